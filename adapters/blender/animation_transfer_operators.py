@@ -11,6 +11,7 @@ import os
 import subprocess
 import platform
 
+from ...core.domain import msgpack_utils
 from ...core.use_cases.save_animation_data import save_animation_data
 from ...core.use_cases.apply_animation_data import load_and_apply_animation
 from ...core.services.animation_data_service import (
@@ -38,6 +39,16 @@ class CROSSRIG_OT_SaveAnimationData(Operator):
         default=""
     )
 
+    file_format: EnumProperty(
+        name="Format",
+        description="File format to save the animation in",
+        items=[
+            ('JSON', "JSON", "Human-readable text file"),
+            ('MSGPACK', "MessagePack", "Smaller binary file, faster to load (requires the msgpack package)"),
+        ],
+        default='JSON'
+    )
+
     def get_action_items(self, context):
         """Get available actions for selected armature."""
         items = []
@@ -77,6 +88,9 @@ class CROSSRIG_OT_SaveAnimationData(Operator):
         layout.prop(self, "action_to_save")
         layout.prop(self, "animation_name")
         layout.prop(self, "description")
+        # Binary files need the optional msgpack package
+        if msgpack_utils.is_available():
+            layout.prop(self, "file_format")
 
     def execute(self, context):
         armature_obj = context.active_object
@@ -94,7 +108,8 @@ class CROSSRIG_OT_SaveAnimationData(Operator):
             armature_obj=armature_obj,
             action_name=self.action_to_save,
             save_name=self.animation_name,
-            description=self.description
+            description=self.description,
+            file_format=self.file_format
         )
 
         if success:
@@ -118,7 +133,7 @@ class CROSSRIG_OT_ApplyAnimationData(Operator):
     )
 
     filter_glob: StringProperty(
-        default="*.json",
+        default="*.json;*.msgpack",
         options={'HIDDEN'}
     )
 
@@ -155,8 +170,8 @@ class CROSSRIG_OT_ApplyAnimationData(Operator):
         if success:
             self.report({'INFO'}, message)
             if warnings:
-                for warning in warnings[:5]:  # Show first 5 warnings
-                    self.report({'WARNING'}, warning)
+                # Show first 5 warnings in a single report
+                self.report({'WARNING'}, "\n".join(warnings[:5]))
             return {'FINISHED'}
         else:
             self.report({'ERROR'}, message)
@@ -226,8 +241,7 @@ class CROSSRIG_OT_ApplyAnimationDataMenu(Operator):
         if success:
             self.report({'INFO'}, message)
             if warnings:
-                for warning in warnings[:5]:
-                    self.report({'WARNING'}, warning)
+                self.report({'WARNING'}, "\n".join(warnings[:5]))
             return {'FINISHED'}
         else:
             self.report({'ERROR'}, message)
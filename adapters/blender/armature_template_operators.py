@@ -376,13 +376,16 @@ class CROSSRIG_OT_LoadArmatureTemplateToMesh(Operator):
             return {'CANCELLED'}
 
         try:
-            # Parent mesh to armature with automatic weights
-            bpy.context.view_layer.objects.active = armature_obj
-            mesh_obj.select_set(True)
-            armature_obj.select_set(True)
-
-            # Set armature as parent with automatic weights
-            bpy.ops.object.parent_set(type='ARMATURE_AUTO')
+            # Parent mesh to armature with automatic weights.
+            # Scope the operator to just these two objects instead of
+            # shuffling the scene selection.
+            with context.temp_override(
+                active_object=armature_obj,
+                object=armature_obj,
+                selected_objects=[mesh_obj, armature_obj],
+                selected_editable_objects=[mesh_obj, armature_obj]
+            ):
+                bpy.ops.object.parent_set(type='ARMATURE_AUTO')
 
             message += f"\nParented to mesh: {mesh_obj.name}"
             self.report({'INFO'}, message)
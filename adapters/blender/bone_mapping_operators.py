@@ -83,10 +83,11 @@ class CROSSRIG_OT_CreateBoneMapping(Operator):
             return {'CANCELLED'}
 
         # Add empty mappings for each source bone
+        # (target_bone defaults to "" - to be filled by user or auto-mapping)
+        add_item = settings.bone_mappings.add
         for bone_name in source_bones:
-            item = settings.bone_mappings.add()
+            item = add_item()
             item.source_bone = bone_name
-            item.target_bone = ""  # Empty - to be filled by user or auto-mapping
             item.confidence = 0.0
 
         self.report({'INFO'}, f"Created bone mapping: {len(source_bones)} bones ready for mapping")
@@ -149,15 +150,12 @@ class CROSSRIG_OT_AutoMapBones(Operator):
             return {'CANCELLED'}
 
         # Update UI collection with auto-mapped results
+        mappings_by_source = {m.source_bone: m for m in updated_preset.mappings}
         for item in settings.bone_mappings:
-            target_bone = updated_preset.find_target_bone(item.source_bone)
-            if target_bone:
-                item.target_bone = target_bone
-                # Find confidence
-                for mapping in updated_preset.mappings:
-                    if mapping.source_bone == item.source_bone:
-                        item.confidence = mapping.confidence
-                        break
+            mapping = mappings_by_source.get(item.source_bone)
+            if mapping and mapping.target_bone:
+                item.target_bone = mapping.target_bone
+                item.confidence = mapping.confidence
 
         self.report({'INFO'}, message)
         return {'FINISHED'}
@@ -292,8 +290,9 @@ class CROSSRIG_OT_LoadBoneMapping(Operator):
         settings.bone_mappings.clear()
 
         # Populate UI collection
+        add_item = settings.bone_mappings.add
         for mapping in mapping_preset.mappings:
-            item = settings.bone_mappings.add()
+            item = add_item()
             item.source_bone = mapping.source_bone
             item.target_bone = mapping.target_bone
             item.confidence = mapping.confidence
@@ -26,7 +26,8 @@ class CROSSRIG_OT_SelectArmatureFromList(Operator):
     def execute(self, context):
         armature = bpy.data.objects.get(self.armature_name)
         if armature and armature.type == "ARMATURE":
-            bpy.ops.object.select_all(action='DESELECT')
+            for obj in context.selected_objects:
+                obj.select_set(False)
             armature.select_set(True)
             context.view_layer.objects.active = armature
             self.report({'INFO'}, f"{self.armature_name} selected.")
@@ -45,19 +46,21 @@ class CROSSRIG_OT_GetActions(Operator):
         prefs = context.scene.crossrig_settings
         prefs.action_collection.clear()
 
+        # Map each action to the first armature using it, for guessing below
+        action_armatures = {}
+        for obj in bpy.data.objects:
+            if obj.type == 'ARMATURE' and obj.animation_data and obj.animation_data.action:
+                action_armatures.setdefault(obj.animation_data.action, obj.name)
+
         for act in bpy.data.actions:
             if REPEAT_ACTION_SUFFIX not in act.name:
-                for fc in act.fcurves:
-                    if "pose.bones[" in fc.data_path:
-                        item = prefs.action_collection.add()
-                        item.action_name = act.name
-                        # Try to guess armature
-                        for obj in bpy.data.objects:
-                            if obj.type == 'ARMATURE' and obj.animation_data:
-                                if obj.animation_data.action == act:
-                                    item.armature_name = obj.name
-                                    break
-                        break
+                if any(fc.data_path.startswith("pose.bones[") for fc in act.fcurves):
+                    item = prefs.action_collection.add()
+                    item.action_name = act.name
+                    # Try to guess armature
+                    armature_name = action_armatures.get(act)
+                    if armature_name:
+                        item.armature_name = armature_name
 
         prefs.order_confirmed = False
         self.report({'INFO'}, "Actions loaded. (Armature references assigned if found.)")
@@ -4,6 +4,9 @@ Blender Operators for Animation Preset Management.
 These operators provide save, load, and delete functionality for presets.
 """
 
+import os
+import subprocess
+
 import bpy
 from bpy.types import Operator
 from bpy.props import StringProperty, EnumProperty
@@ -14,7 +17,8 @@ from ...core.use_cases import (
 )
 from ...core.services.preset_service import (
     list_available_presets,
-    delete_preset_file
+    delete_preset_file,
+    get_preset_directory
 )
 
 
@@ -108,9 +112,9 @@ class CROSSRIG_OT_LoadPreset(Operator):
 
         if success:
             self.report({'INFO'}, message)
-            # Show warnings if any
-            for warning in warnings:
-                self.report({'WARNING'}, warning)
+            # Show warnings if any (one report, one redraw)
+            if warnings:
+                self.report({'WARNING'}, "\n".join(warnings))
             return {'FINISHED'}
         else:
             self.report({'ERROR'}, message)
@@ -118,7 +122,6 @@ class CROSSRIG_OT_LoadPreset(Operator):
 
     def invoke(self, context, event):
         # Open file browser starting at preset directory
-        from ...core.services.preset_service import get_preset_directory
         preset_dir = get_preset_directory()
         self.filepath = str(preset_dir / "")
 
@@ -167,8 +170,8 @@ class CROSSRIG_OT_LoadPresetMenu(Operator):
 
         if success:
             self.report({'INFO'}, message)
-            for warning in warnings:
-                self.report({'WARNING'}, warning)
+            if warnings:
+                self.report({'WARNING'}, "\n".join(warnings))
             return {'FINISHED'}
         else:
             self.report({'ERROR'}, message)
@@ -238,10 +241,6 @@ class CROSSRIG_OT_OpenPresetFolder(Operator):
     bl_description = "Open the folder where presets are stored"
 
     def execute(self, context):
-        import os
-        import subprocess
-        from ...core.services.preset_service import get_preset_directory
-
         preset_dir = get_preset_directory()
 
         try:
@@ -44,7 +44,8 @@ def action_index_update(self, context):
 
     if arm_name and arm_name in bpy.data.objects:
         arm_obj = bpy.data.objects[arm_name]
-        bpy.ops.object.select_all(action='DESELECT')
+        for obj in context.selected_objects:
+            obj.select_set(False)
         arm_obj.select_set(True)
         context.view_layer.objects.active = arm_obj
 
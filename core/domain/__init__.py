@@ -9,6 +9,8 @@ from .preset_entities import AnimationPreset, PresetActionItem
 from .math_utils import (
     get_axis_vector,
     rotate_2d_point,
+    rotate_2d_point_precomputed,
+    get_rotation_cos_sin,
     calculate_offset_vector,
     is_rotation_needed
 )
@@ -21,6 +23,8 @@ __all__ = [
     'PresetActionItem',
     'get_axis_vector',
     'rotate_2d_point',
+    'rotate_2d_point_precomputed',
+    'get_rotation_cos_sin',
     'calculate_offset_vector',
     'is_rotation_needed',
 ]
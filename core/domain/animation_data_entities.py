@@ -5,12 +5,19 @@ This module defines pure Python data structures for representing
 animation keyframe data independent of Blender.
 """
 
+import sys
+from operator import itemgetter
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
-import json
 
+from . import json_utils, msgpack_utils
 
-@dataclass
+# Required-key getters for from_dict (one C-level call instead of two lookups)
+_keyframe_required = itemgetter('frame', 'value')
+_fcurve_required = itemgetter('data_path', 'array_index')
+
+
+@dataclass(slots=True)
 class KeyframeData:
     """
     Represents a single keyframe on an animation curve.
@@ -25,31 +32,45 @@ class KeyframeData:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            'frame': self.frame,
-            'value': self.value,
-            'interpolation': self.interpolation,
-            'handle_left': list(self.handle_left),
-            'handle_right': list(self.handle_right),
-            'handle_left_type': self.handle_left_type,
-            'handle_right_type': self.handle_right_type
-        }
+        return _keyframe_to_dict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'KeyframeData':
         """Create from dictionary."""
-        return cls(
-            frame=data['frame'],
-            value=data['value'],
-            interpolation=data.get('interpolation', 'BEZIER'),
-            handle_left=tuple(data.get('handle_left', [0.0, 0.0])),
-            handle_right=tuple(data.get('handle_right', [0.0, 0.0])),
-            handle_left_type=data.get('handle_left_type', 'AUTO'),
-            handle_right_type=data.get('handle_right_type', 'AUTO')
-        )
-
-
-@dataclass
+        return _keyframe_from_dict(data)
+
+
+# Keyframe (de)serialization as plain functions: FCurveData maps them over
+# every keyframe, where method lookups and keyword arguments add up.
+
+def _keyframe_to_dict(kf: KeyframeData) -> Dict[str, Any]:
+    """Convert a keyframe to a dictionary for serialization."""
+    return {
+        'frame': kf.frame,
+        'value': kf.value,
+        'interpolation': kf.interpolation,
+        'handle_left': list(kf.handle_left),
+        'handle_right': list(kf.handle_right),
+        'handle_left_type': kf.handle_left_type,
+        'handle_right_type': kf.handle_right_type
+    }
+
+
+def _keyframe_from_dict(data: Dict[str, Any]) -> KeyframeData:
+    """Create a keyframe from a dictionary."""
+    # Positional in KeyframeData field order: (frame, value), interpolation,
+    # handle_left, handle_right, handle_left_type, handle_right_type
+    return KeyframeData(
+        *_keyframe_required(data),
+        data.get('interpolation', 'BEZIER'),
+        tuple(data.get('handle_left', (0.0, 0.0))),
+        tuple(data.get('handle_right', (0.0, 0.0))),
+        data.get('handle_left_type', 'AUTO'),
+        data.get('handle_right_type', 'AUTO')
+    )
+
+
+@dataclass(slots=True)
 class FCurveData:
     """
     Represents an animation curve (fcurve) with all keyframes.
@@ -64,12 +85,16 @@ class FCurveData:
     # Modifiers (if any)
     modifiers: List[Dict[str, Any]] = field(default_factory=list)
 
+    def __post_init__(self):
+        """Intern data path; each path repeats once per array index."""
+        self.data_path = sys.intern(self.data_path)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             'data_path': self.data_path,
             'array_index': self.array_index,
-            'keyframes': [kf.to_dict() for kf in self.keyframes],
+            'keyframes': [_keyframe_to_dict(kf) for kf in self.keyframes],
             'extrapolation': self.extrapolation,
             'modifiers': self.modifiers
         }
@@ -77,17 +102,19 @@ class FCurveData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FCurveData':
         """Create from dictionary."""
-        keyframes = [KeyframeData.from_dict(kf) for kf in data.get('keyframes', [])]
+        keyframes = [_keyframe_from_dict(kf) for kf in data.get('keyframes', ())]
+
+        data_path, array_index = _fcurve_required(data)
         return cls(
-            data_path=data['data_path'],
-            array_index=data['array_index'],
+            data_path=data_path,
+            array_index=array_index,
             keyframes=keyframes,
             extrapolation=data.get('extrapolation', 'CONSTANT'),
             modifiers=data.get('modifiers', [])
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BoneAnimationData:
     """
     Represents animation data for a single bone.
@@ -95,6 +122,10 @@ class BoneAnimationData:
     bone_name: str
     fcurves: List[FCurveData] = field(default_factory=list)
 
+    def __post_init__(self):
+        """Intern bone name so it is shared with mapping and armature data."""
+        self.bone_name = sys.intern(self.bone_name)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -112,7 +143,7 @@ class BoneAnimationData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationData:
     """
     Represents complete animation data from an armature action.
@@ -170,10 +201,19 @@ class AnimationData:
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return json_utils.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> 'AnimationData':
-        """Deserialize from JSON string."""
-        data = json.loads(json_str)
+        """Deserialize from JSON string (or UTF-8 encoded bytes)."""
+        data = json_utils.loads(json_str)
         return cls.from_dict(data)
+
+    def to_msgpack(self) -> bytes:
+        """Serialize to MessagePack bytes (requires the msgpack package)."""
+        return msgpack_utils.packb(self.to_dict())
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> 'AnimationData':
+        """Deserialize from MessagePack bytes (requires the msgpack package)."""
+        return cls.from_dict(msgpack_utils.unpackb(data))
@@ -5,12 +5,14 @@ This module defines pure Python data structures for representing
 armature bone structures independent of Blender.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
-import json
 
+from . import json_utils
 
-@dataclass
+
+@dataclass(slots=True)
 class BoneData:
     """
     Represents a single bone's data in the armature.
@@ -33,12 +35,37 @@ class BoneData:
     use_local_location: bool = True
     use_deform: bool = True
 
-    # Bone layers (which layers bone is visible on)
-    layers: List[bool] = field(default_factory=lambda: [True] + [False] * 31)
+    # Bone layers as a 32-bit mask (bit N set = visible on layer N)
+    layers_mask: int = 1
 
     # Custom properties
     custom_properties: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        """Intern bone names so parent references share the name strings."""
+        self.name = sys.intern(self.name)
+        if self.parent_name is not None:
+            self.parent_name = sys.intern(self.parent_name)
+
+    @property
+    def layers(self) -> List[bool]:
+        """Bone layers as a 32-element list of bools (legacy view of layers_mask)."""
+        mask = self.layers_mask
+        return [bool(mask >> i & 1) for i in range(32)]
+
+    @layers.setter
+    def layers(self, value) -> None:
+        self.layers_mask = self.layers_to_mask(value)
+
+    @staticmethod
+    def layers_to_mask(layers) -> int:
+        """Fold a sequence of layer flags into a bitmask."""
+        mask = 0
+        for i, enabled in enumerate(layers):
+            if enabled:
+                mask |= 1 << i
+        return mask
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert bone data to dictionary for JSON serialization."""
         return {
@@ -52,13 +79,21 @@ class BoneData:
             'inherit_scale': self.inherit_scale,
             'use_local_location': self.use_local_location,
             'use_deform': self.use_deform,
+            # Legacy list kept so older versions of the addon can still read
+            # templates saved by this one
             'layers': self.layers,
+            'layers_mask': self.layers_mask,
             'custom_properties': self.custom_properties
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BoneData':
         """Create BoneData instance from dictionary."""
+        # Older templates store layers as a list of 32 bools
+        layers_mask = data.get('layers_mask')
+        if layers_mask is None:
+            layers_mask = cls.layers_to_mask(data.get('layers', (True,)))
+
         return cls(
             name=data['name'],
             parent_name=data.get('parent_name'),
@@ -70,12 +105,12 @@ class BoneData:
             inherit_scale=data.get('inherit_scale', 'FULL'),
             use_local_location=data.get('use_local_location', True),
             use_deform=data.get('use_deform', True),
-            layers=data.get('layers', [True] + [False] * 31),
+            layers_mask=layers_mask,
             custom_properties=data.get('custom_properties', {})
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ArmatureTemplate:
     """
     Represents a complete armature structure template.
@@ -127,10 +162,10 @@ class ArmatureTemplate:
 
     def to_json(self) -> str:
         """Serialize template to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return json_utils.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> 'ArmatureTemplate':
-        """Deserialize template from JSON string."""
-        data = json.loads(json_str)
+        """Deserialize template from JSON string (or UTF-8 encoded bytes)."""
+        data = json_utils.loads(json_str)
         return cls.from_dict(data)
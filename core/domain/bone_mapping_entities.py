@@ -5,23 +5,58 @@ This module defines pure Python data structures for representing
 bone mappings between different armature types.
 """
 
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-import json
+from typing import List, Dict, Any, Optional, Iterable, Iterator
 from datetime import datetime
 
+from . import json_utils
 
-@dataclass
+# Last generated ISO timestamp, reused for up to a second (see _now_iso)
+_last_timestamp: Optional[str] = None
+_last_timestamp_monotonic = 0.0
+
+
+def _now_iso() -> str:
+    """
+    Get the current time as an ISO 8601 string.
+
+    The formatted timestamp is reused for up to one second so batch
+    creation/updates of presets don't format a new datetime on every call.
+
+    Returns:
+        str: ISO formatted timestamp
+    """
+    global _last_timestamp, _last_timestamp_monotonic
+    now = time.monotonic()
+    if _last_timestamp is None or now - _last_timestamp_monotonic > 1.0:
+        _last_timestamp = datetime.now().isoformat()
+        _last_timestamp_monotonic = now
+    return _last_timestamp
+
+
+@dataclass(slots=True, frozen=True)
 class BoneMapping:
     """
     Represents a single bone-to-bone mapping.
 
     Maps a source bone name to a target bone name with optional
     confidence score for auto-generated mappings.
+
+    Mappings are immutable. Equality and hashing use only the
+    (source_bone, target_bone) pair, so mappings can be deduplicated
+    with sets regardless of confidence.
     """
     source_bone: str
     target_bone: str
-    confidence: float = 1.0  # 0.0-1.0, where 1.0 = manually confirmed or exact match
+    # 0.0-1.0, where 1.0 = manually confirmed or exact match
+    confidence: float = field(default=1.0, compare=False)
+
+    def __post_init__(self):
+        """Intern bone names; the same few names repeat across every preset."""
+        object.__setattr__(self, 'source_bone', sys.intern(self.source_bone))
+        object.__setattr__(self, 'target_bone', sys.intern(self.target_bone))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -41,17 +76,22 @@ class BoneMapping:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BoneMappingPreset:
     """
     Represents a complete bone mapping configuration between two armature types.
 
     Contains all bone mappings and metadata needed to transfer animations
     between different armature structures (e.g., Mixamo → AccuRig).
+
+    Change mappings through add_mapping()/remove_mapping() only. Lookups go
+    through indexes that those methods keep in sync with the list.
     """
     name: str
     source_armature_name: str
     target_armature_name: str
+    # Read-only outside this class: appending, removing or reassigning here
+    # directly leaves the lookup indexes stale (see _rebuild_index)
     mappings: List[BoneMapping] = field(default_factory=list)
     description: str = ""
 
@@ -66,36 +106,75 @@ class BoneMappingPreset:
     # Version for forward compatibility
     version: str = "1.0"
 
+    # Lookup indexes over mappings (not serialized)
+    _source_index: Dict[str, BoneMapping] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _target_index: Dict[str, BoneMapping] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _mapping_dict_cache: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _reverse_mapping_dict_cache: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
-        """Initialize dates if not provided."""
+        """Initialize dates if not provided and build lookup indexes."""
         if not self.created_date:
-            self.created_date = datetime.now().isoformat()
+            self.created_date = _now_iso()
         if not self.modified_date:
             self.modified_date = self.created_date
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Rebuild source/target lookup indexes from mappings."""
+        self._source_index = {}
+        self._target_index = {}
+        self._mapping_dict_cache = None
+        self._reverse_mapping_dict_cache = None
+        for mapping in self.mappings:
+            self._index_mapping(mapping)
+
+    def _index_mapping(self, mapping: BoneMapping):
+        """Add a single mapping to the lookup indexes (first match wins)."""
+        self._source_index.setdefault(mapping.source_bone, mapping)
+        self._target_index.setdefault(mapping.target_bone, mapping)
+        self._mapping_dict_cache = None
+        self._reverse_mapping_dict_cache = None
 
     def update_metadata(self):
         """Update metadata based on current mappings."""
         self.mapped_count = len(self.mappings)
         self.auto_mapped_count = sum(1 for m in self.mappings if m.confidence < 1.0)
-        self.modified_date = datetime.now().isoformat()
+        self.modified_date = _now_iso()
 
     def get_mapping_dict(self) -> Dict[str, str]:
         """
         Get a simple dictionary mapping source bone names to target bone names.
 
+        The dict is cached until the mappings change; treat it as read-only.
+
         Returns:
             Dict mapping source_bone → target_bone
         """
-        return {m.source_bone: m.target_bone for m in self.mappings}
+        if self._mapping_dict_cache is None:
+            self._mapping_dict_cache = {m.source_bone: m.target_bone for m in self.mappings}
+        return self._mapping_dict_cache
 
     def get_reverse_mapping_dict(self) -> Dict[str, str]:
         """
         Get a reverse dictionary mapping target bone names to source bone names.
 
+        The dict is cached until the mappings change; treat it as read-only.
+
         Returns:
             Dict mapping target_bone → source_bone
         """
-        return {m.target_bone: m.source_bone for m in self.mappings}
+        if self._reverse_mapping_dict_cache is None:
+            self._reverse_mapping_dict_cache = {m.target_bone: m.source_bone for m in self.mappings}
+        return self._reverse_mapping_dict_cache
 
     def find_target_bone(self, source_bone: str) -> Optional[str]:
         """
@@ -107,10 +186,8 @@ class BoneMappingPreset:
         Returns:
             Target bone name or None if not found
         """
-        for mapping in self.mappings:
-            if mapping.source_bone == source_bone:
-                return mapping.target_bone
-        return None
+        mapping = self._source_index.get(source_bone)
+        return mapping.target_bone if mapping else None
 
     def find_source_bone(self, target_bone: str) -> Optional[str]:
         """
@@ -122,10 +199,8 @@ class BoneMappingPreset:
         Returns:
             Source bone name or None if not found
         """
-        for mapping in self.mappings:
-            if mapping.target_bone == target_bone:
-                return mapping.source_bone
-        return None
+        mapping = self._target_index.get(target_bone)
+        return mapping.source_bone if mapping else None
 
     def add_mapping(self, source_bone: str, target_bone: str, confidence: float = 1.0):
         """
@@ -136,16 +211,20 @@ class BoneMappingPreset:
             target_bone: Target bone name
             confidence: Confidence score (0.0-1.0)
         """
+        mapping = BoneMapping(source_bone, target_bone, confidence)
+
         # Check if mapping already exists
-        for i, mapping in enumerate(self.mappings):
-            if mapping.source_bone == source_bone:
-                # Update existing mapping
-                self.mappings[i] = BoneMapping(source_bone, target_bone, confidence)
-                self.update_metadata()
-                return
+        existing = self._source_index.get(source_bone)
+        if existing is not None:
+            # Update existing mapping
+            self.mappings[self.mappings.index(existing)] = mapping
+            self._rebuild_index()
+            self.update_metadata()
+            return
 
         # Add new mapping
-        self.mappings.append(BoneMapping(source_bone, target_bone, confidence))
+        self.mappings.append(mapping)
+        self._index_mapping(mapping)
         self.update_metadata()
 
     def remove_mapping(self, source_bone: str):
@@ -156,8 +235,35 @@ class BoneMappingPreset:
             source_bone: Source bone name to remove
         """
         self.mappings = [m for m in self.mappings if m.source_bone != source_bone]
+        self._rebuild_index()
         self.update_metadata()
 
+    def iter_unmapped_source_bones(self, all_source_bones: Iterable[str]) -> Iterator[str]:
+        """
+        Iterate over source bones that don't have mappings.
+
+        Args:
+            all_source_bones: Source bone names to check
+
+        Returns:
+            Iterator of unmapped source bone names
+        """
+        mapped_sources = self._source_index.keys()
+        return (bone for bone in all_source_bones if bone not in mapped_sources)
+
+    def iter_unmapped_target_bones(self, all_target_bones: Iterable[str]) -> Iterator[str]:
+        """
+        Iterate over target bones that aren't mapped to.
+
+        Args:
+            all_target_bones: Target bone names to check
+
+        Returns:
+            Iterator of unmapped target bone names
+        """
+        mapped_targets = self._target_index.keys()
+        return (bone for bone in all_target_bones if bone not in mapped_targets)
+
     def get_unmapped_source_bones(self, all_source_bones: List[str]) -> List[str]:
         """
         Get list of source bones that don't have mappings.
@@ -168,8 +274,7 @@ class BoneMappingPreset:
         Returns:
             List of unmapped source bone names
         """
-        mapped_sources = {m.source_bone for m in self.mappings}
-        return [bone for bone in all_source_bones if bone not in mapped_sources]
+        return list(self.iter_unmapped_source_bones(all_source_bones))
 
     def get_unmapped_target_bones(self, all_target_bones: List[str]) -> List[str]:
         """
@@ -181,8 +286,7 @@ class BoneMappingPreset:
         Returns:
             List of unmapped target bone names
         """
-        mapped_targets = {m.target_bone for m in self.mappings}
-        return [bone for bone in all_target_bones if bone not in mapped_targets]
+        return list(self.iter_unmapped_target_bones(all_target_bones))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -206,7 +310,11 @@ class BoneMappingPreset:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BoneMappingPreset':
         """Create from dictionary."""
-        mappings = [BoneMapping.from_dict(m) for m in data.get('mappings', [])]
+        # Construct mappings positionally; skips a from_dict call per mapping
+        mappings = [
+            BoneMapping(m['source_bone'], m['target_bone'], m.get('confidence', 1.0))
+            for m in data.get('mappings', [])
+        ]
         metadata = data.get('metadata', {})
 
         return cls(
@@ -226,10 +334,10 @@ class BoneMappingPreset:
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return json_utils.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> 'BoneMappingPreset':
-        """Deserialize from JSON string."""
-        data = json.loads(json_str)
+        """Deserialize from JSON string (or UTF-8 encoded bytes)."""
+        data = json_utils.loads(json_str)
         return cls.from_dict(data)
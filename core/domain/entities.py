@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionItem:
     """
     Represents an animation action to be sequenced.
@@ -28,7 +28,7 @@ class ActionItem:
     angle: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationSettings:
     """
     Settings for animation sequencing.
@@ -45,7 +45,7 @@ class AnimationSettings:
     order_confirmed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportSettings:
     """
     Settings for FBX export.
@@ -0,0 +1,23 @@
+"""
+Filename helpers shared by the file-based services.
+
+Pure string functions with no filesystem access.
+"""
+
+# Characters not allowed in filenames on Windows (and '/' on all platforms)
+_INVALID_FILENAME_CHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
+def sanitize_filename(name: str) -> str:
+    """
+    Sanitize a preset, template or animation name for use as filename.
+
+    Args:
+        name: Name to sanitize
+
+    Returns:
+        str: Safe filename
+    """
+    # Replace invalid filename characters, remove leading/trailing
+    # spaces and dots, and limit length
+    return name.translate(_INVALID_FILENAME_CHARS).strip('. ')[:100]
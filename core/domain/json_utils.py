@@ -0,0 +1,94 @@
+"""
+JSON encoding helpers for domain entity serialization.
+
+Uses orjson when it is installed (C-accelerated) and falls back to the
+standard library json module otherwise. Both produce 2-space indented
+output that either backend can read back.
+"""
+
+import json
+import re
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; Blender does not bundle it
+    orjson = None
+
+# Raised by loads() for invalid JSON with either backend (orjson's error
+# subclasses the stdlib one).
+JSONDecodeError = json.JSONDecodeError
+
+# "name" as the first key of the top-level object. Entities serialize their
+# name first, so file listings can read it from the file header alone.
+_LEADING_NAME_RE = re.compile(rb'\A\s*\{\s*"name"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Bytes to read from the start of a file when looking for its name
+NAME_HEADER_SIZE = 4096
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize object to an indented JSON string.
+
+    Args:
+        obj: JSON-compatible object (dicts, lists, tuples, str, numbers)
+
+    Returns:
+        str: JSON text indented with 2 spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize object to indented UTF-8 encoded JSON, ready to write to disk.
+
+    Args:
+        obj: JSON-compatible object (dicts, lists, tuples, str, numbers)
+
+    Returns:
+        bytes: UTF-8 JSON indented with 2 spaces, ending in a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2) + '\n').encode('utf-8')
+
+
+def loads(data) -> Any:
+    """
+    Deserialize JSON text.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def scan_leading_name(head: bytes) -> Optional[str]:
+    """
+    Extract the top-level "name" value from the start of a JSON document.
+
+    Only matches when "name" is the first key of the top-level object, so a
+    nested "name" (e.g. of a bone) is never picked up.
+
+    Args:
+        head: First bytes of a JSON document
+
+    Returns:
+        Decoded name, or None if it is not the leading key or is cut off
+    """
+    match = _LEADING_NAME_RE.match(head)
+    if match is None:
+        return None
+    try:
+        return json.loads(b'"' + match.group(1) + b'"')
+    except ValueError:
+        return None
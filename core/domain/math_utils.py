@@ -6,8 +6,20 @@ All functions are pure (no side effects) and deterministic.
 """
 
 import math
+from functools import lru_cache
 from mathutils import Vector
 
+# Axis notation -> unit direction, built once at import
+_AXIS_VECTORS = {
+    'X+': (1, 0, 0),
+    'X-': (-1, 0, 0),
+    'Y+': (0, 1, 0),
+    'Y-': (0, -1, 0),
+    'Z+': (0, 0, 1),
+    'Z-': (0, 0, -1),
+}
+_DEFAULT_AXIS_VECTOR = _AXIS_VECTORS['Y+']
+
 
 def get_axis_vector(forward_axis: str) -> tuple:
     """
@@ -25,15 +37,48 @@ def get_axis_vector(forward_axis: str) -> tuple:
         >>> get_axis_vector('X-')
         (-1, 0, 0)
     """
-    axis_map = {
-        'X+': (1, 0, 0),
-        'X-': (-1, 0, 0),
-        'Y+': (0, 1, 0),
-        'Y-': (0, -1, 0),
-        'Z+': (0, 0, 1),
-        'Z-': (0, 0, -1),
-    }
-    return axis_map.get(forward_axis, (0, 1, 0))
+    return _AXIS_VECTORS.get(forward_axis, _DEFAULT_AXIS_VECTOR)
+
+
+@lru_cache(maxsize=32)
+def get_rotation_cos_sin(angle_deg: float) -> tuple:
+    """
+    Get cosine and sine of a rotation angle.
+
+    Results are cached; callers typically rotate many points by the
+    same handful of angles.
+
+    Args:
+        angle_deg: Rotation angle in degrees
+
+    Returns:
+        Tuple of (cos, sin) of the angle
+
+    Examples:
+        >>> get_rotation_cos_sin(0.0)
+        (1.0, 0.0)
+    """
+    angle_rad = math.radians(angle_deg)
+    return (math.cos(angle_rad), math.sin(angle_rad))
+
+
+def rotate_2d_point_precomputed(x: float, y: float, cos_a: float, sin_a: float) -> tuple:
+    """
+    Rotate a 2D point around the origin using precomputed cos/sin.
+
+    Use with get_rotation_cos_sin() when rotating many points by the
+    same angle.
+
+    Args:
+        x: X coordinate
+        y: Y coordinate
+        cos_a: Cosine of the rotation angle
+        sin_a: Sine of the rotation angle
+
+    Returns:
+        Tuple of (x_new, y_new) rotated coordinates
+    """
+    return (x * cos_a - y * sin_a, x * sin_a + y * cos_a)
 
 
 def rotate_2d_point(x: float, y: float, angle_deg: float) -> tuple:
@@ -60,16 +105,9 @@ def rotate_2d_point(x: float, y: float, angle_deg: float) -> tuple:
     if abs(angle_deg) < 0.001:
         return (x, y)
 
-    # Convert to radians
-    angle_rad = math.radians(angle_deg)
-    cos_a = math.cos(angle_rad)
-    sin_a = math.sin(angle_rad)
-
     # Apply rotation matrix
-    x_new = x * cos_a - y * sin_a
-    y_new = x * sin_a + y * cos_a
-
-    return (x_new, y_new)
+    cos_a, sin_a = get_rotation_cos_sin(angle_deg)
+    return rotate_2d_point_precomputed(x, y, cos_a, sin_a)
 
 
 def calculate_offset_vector(start_loc: Vector, target_loc: Vector) -> Vector:
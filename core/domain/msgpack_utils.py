@@ -0,0 +1,75 @@
+"""
+MessagePack encoding helpers for the optional binary file format.
+
+Binary files are opt-in (the Format option when saving an animation;
+they use the .msgpack extension) and require the msgpack package, which
+Blender does not bundle. JSON stays the default format.
+"""
+
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional
+    msgpack = None
+
+# File extension selecting the binary format
+MSGPACK_EXTENSION = '.msgpack'
+
+
+def is_available() -> bool:
+    """Check whether the msgpack package is installed."""
+    return msgpack is not None
+
+
+def packb(obj: Any) -> bytes:
+    """
+    Serialize object to MessagePack bytes.
+
+    Args:
+        obj: Serializable object (dicts, lists, tuples, str, numbers)
+
+    Returns:
+        bytes: Packed data
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise RuntimeError("The msgpack package is required for .msgpack files")
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """
+    Deserialize MessagePack bytes.
+
+    Args:
+        data: Packed data
+
+    Returns:
+        Unpacked Python object (lists for arrays, str for strings)
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise RuntimeError("The msgpack package is required for .msgpack files")
+    return msgpack.unpackb(data, raw=False)
+
+
+def is_msgpack(head: bytes) -> bool:
+    """
+    Sniff whether file contents are MessagePack rather than JSON.
+
+    Every saved document is a JSON object, so JSON files start with '{'
+    (after optional whitespace); anything else is treated as MessagePack.
+
+    Args:
+        head: First bytes of the file
+
+    Returns:
+        bool: True if the data is not a JSON object
+    """
+    stripped = head.lstrip()
+    return bool(stripped) and stripped[:1] != b'{'
@@ -6,10 +6,11 @@ These are pure data structures for animation presets.
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
-import json
 
+from . import json_utils
 
-@dataclass
+
+@dataclass(slots=True)
 class PresetActionItem:
     """
     Individual action in a preset.
@@ -45,7 +46,7 @@ class PresetActionItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationPreset:
     """
     Complete animation sequence preset.
@@ -99,10 +100,10 @@ class AnimationPreset:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return json_utils.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> 'AnimationPreset':
-        """Create from JSON string."""
-        data = json.loads(json_str)
+        """Create from JSON string (or UTF-8 encoded bytes)."""
+        data = json_utils.loads(json_str)
         return cls.from_dict(data)
@@ -6,6 +6,7 @@ while keeping Blender-specific code isolated.
 """
 
 from .action_service import (
+    get_location_fcurves,
     get_local_location_at_frame,
     get_action_start_location_local,
     get_action_end_location_local,
@@ -25,6 +26,7 @@ from .preset_service import (
 )
 
 __all__ = [
+    'get_location_fcurves',
     'get_local_location_at_frame',
     'get_action_start_location_local',
     'get_action_end_location_local',
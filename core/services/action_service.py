@@ -5,12 +5,42 @@ These services contain business logic that interacts with Blender actions
 but are separated from operators for better testability.
 """
 
+from typing import Dict, Optional
+
+import numpy as np
 from mathutils import Vector
-from ..domain.math_utils import rotate_2d_point, is_rotation_needed
+from ..domain.math_utils import get_rotation_cos_sin, is_rotation_needed
 from ...config.constants import REPEAT_ACTION_SUFFIX
 
 
-def get_local_location_at_frame(action, bone_name: str, frame: int) -> Vector:
+def get_location_fcurves(action, bone_name: str) -> Dict[int, object]:
+    """
+    Find a bone's location fcurves in a single pass over the action.
+
+    Callers that run several operations on the same action can look the
+    fcurves up once and pass the result to the functions below.
+
+    Args:
+        action: Blender Action object
+        bone_name: Name of the bone
+
+    Returns:
+        Dict mapping array index (0=X, 1=Y, 2=Z) to FCurve
+    """
+    data_path = f'pose.bones["{bone_name}"].location'
+    fcurves_dict = {}
+
+    for fc in action.fcurves:
+        if fc.data_path == data_path:
+            fcurves_dict[fc.array_index] = fc
+            if len(fcurves_dict) == 3:
+                break
+
+    return fcurves_dict
+
+
+def get_local_location_at_frame(action, bone_name: str, frame: int,
+                                location_fcurves: Optional[Dict[int, object]] = None) -> Vector:
     """
     Get bone's local location at specific frame from action fcurves.
 
@@ -18,52 +48,94 @@ def get_local_location_at_frame(action, bone_name: str, frame: int) -> Vector:
         action: Blender Action object
         bone_name: Name of the bone
         frame: Frame number to evaluate
+        location_fcurves: Result of get_location_fcurves(), if already known
 
     Returns:
         Vector containing the location at that frame
     """
+    if location_fcurves is None:
+        location_fcurves = get_location_fcurves(action, bone_name)
+
     loc = [0.0, 0.0, 0.0]
-    data_path = f'pose.bones["{bone_name}"].location'
+    for idx, fc in location_fcurves.items():
+        loc[idx] = fc.evaluate(frame)
 
-    for fc in action.fcurves:
-        if fc.data_path == data_path:
-            idx = fc.array_index
-            loc[idx] = fc.evaluate(frame)
+    return Vector(loc)
+
+
+def _get_location_at_end_keyframe(location_fcurves: Dict[int, object], frame: int,
+                                  key_index: int) -> Vector:
+    """
+    Get location at the first or last keyframe of each location fcurve.
+
+    Reads the raw keyframe value when that keyframe sits exactly on the
+    requested frame, skipping the fcurve evaluator. Falls back to
+    evaluate() otherwise, or when modifiers could change the value.
+
+    Args:
+        location_fcurves: Result of get_location_fcurves()
+        frame: Frame the location is wanted at
+        key_index: 0 for the first keyframe, -1 for the last
+
+    Returns:
+        Vector containing the location at that frame
+    """
+    loc = [0.0, 0.0, 0.0]
+
+    for idx, fc in location_fcurves.items():
+        points = fc.keyframe_points
+        if points and not fc.modifiers:
+            co = points[key_index].co
+            if co[0] == frame:
+                loc[idx] = co[1]
+                continue
+        loc[idx] = fc.evaluate(frame)
 
     return Vector(loc)
 
 
-def get_action_start_location_local(action, bone_name: str) -> Vector:
+def get_action_start_location_local(action, bone_name: str,
+                                    location_fcurves: Optional[Dict[int, object]] = None) -> Vector:
     """
     Get bone's location at action start frame.
 
     Args:
         action: Blender Action object
         bone_name: Name of the bone
+        location_fcurves: Result of get_location_fcurves(), if already known
 
     Returns:
         Vector of starting location
     """
+    if location_fcurves is None:
+        location_fcurves = get_location_fcurves(action, bone_name)
+
     start_frame = int(action.frame_range[0])
-    return get_local_location_at_frame(action, bone_name, start_frame)
+    return _get_location_at_end_keyframe(location_fcurves, start_frame, 0)
 
 
-def get_action_end_location_local(action, bone_name: str) -> Vector:
+def get_action_end_location_local(action, bone_name: str,
+                                  location_fcurves: Optional[Dict[int, object]] = None) -> Vector:
     """
     Get bone's location at action end frame.
 
     Args:
         action: Blender Action object
         bone_name: Name of the bone
+        location_fcurves: Result of get_location_fcurves(), if already known
 
     Returns:
         Vector of ending location
     """
+    if location_fcurves is None:
+        location_fcurves = get_location_fcurves(action, bone_name)
+
     end_frame = int(action.frame_range[1])
-    return get_local_location_at_frame(action, bone_name, end_frame)
+    return _get_location_at_end_keyframe(location_fcurves, end_frame, -1)
 
 
-def offset_action_root_local(action, bone_name: str, offset_vec: Vector):
+def offset_action_root_local(action, bone_name: str, offset_vec: Vector,
+                             location_fcurves: Optional[Dict[int, object]] = None):
     """
     Apply offset to all location keyframes of bone.
 
@@ -71,16 +143,35 @@ def offset_action_root_local(action, bone_name: str, offset_vec: Vector):
         action: Blender Action object
         bone_name: Name of the root bone
         offset_vec: Vector to add to all keyframes
+        location_fcurves: Result of get_location_fcurves(), if already known
     """
-    data_path = f'pose.bones["{bone_name}"].location'
-    fcurves = [fc for fc in action.fcurves if fc.data_path == data_path]
+    # Nothing to move (common for continuous sequences)
+    if offset_vec.length_squared < 1e-12:
+        return
+
+    if location_fcurves is None:
+        location_fcurves = get_location_fcurves(action, bone_name)
+
+    for idx, fc in location_fcurves.items():
+        if idx >= len(offset_vec):
+            continue
 
-    if fcurves:
-        for i, fc in enumerate(fcurves):
-            for kp in fc.keyframe_points:
-                if i < len(offset_vec):
-                    kp.co[1] += offset_vec[i]
-            fc.update()
+        # Skip axes with no meaningful offset; avoids touching keyframes
+        # and the fcurve update on no-op axes
+        offset = offset_vec[idx]
+        if abs(offset) < 1e-6:
+            continue
+
+        points = fc.keyframe_points
+        if not points:
+            continue
+
+        # Bulk-read (frame, value) pairs, shift the values, write back
+        co = np.empty(len(points) * 2, dtype=np.float32)
+        points.foreach_get("co", co)
+        co[1::2] += float(offset)
+        points.foreach_set("co", co)
+        fc.update()
 
 
 def create_action_copy(original_action, repeat_index: int = 1):
@@ -99,7 +190,8 @@ def create_action_copy(original_action, repeat_index: int = 1):
     return new_action
 
 
-def rotate_action_root_trajectory(action, bone_name: str, angle_deg: float, forward_axis: str = 'Y+'):
+def rotate_action_root_trajectory(action, bone_name: str, angle_deg: float, forward_axis: str = 'Y+',
+                                  location_fcurves: Optional[Dict[int, object]] = None):
     """
     Rotate the root bone's location trajectory by specified angle.
 
@@ -111,6 +203,7 @@ def rotate_action_root_trajectory(action, bone_name: str, angle_deg: float, forw
         bone_name: Name of the root bone (e.g., "mixamorig:Hips")
         angle_deg: Rotation angle in degrees (positive = counter-clockwise)
         forward_axis: Character's forward direction ('Y+', 'X+', etc.)
+        location_fcurves: Result of get_location_fcurves(), if already known
 
     Note:
         - Rotation is applied in the XY plane (ground plane)
@@ -122,12 +215,9 @@ def rotate_action_root_trajectory(action, bone_name: str, angle_deg: float, forw
         return
 
     # Find location fcurves for root bone
-    data_path = f'pose.bones["{bone_name}"].location'
-    fcurves_dict = {}
-
-    for fc in action.fcurves:
-        if fc.data_path == data_path:
-            fcurves_dict[fc.array_index] = fc
+    fcurves_dict = location_fcurves
+    if fcurves_dict is None:
+        fcurves_dict = get_location_fcurves(action, bone_name)
 
     # Need at least X and Y curves to rotate
     if 0 not in fcurves_dict or 1 not in fcurves_dict:
@@ -135,48 +225,56 @@ def rotate_action_root_trajectory(action, bone_name: str, angle_deg: float, forw
 
     fc_x = fcurves_dict[0]
     fc_y = fcurves_dict[1]
+    points_x = fc_x.keyframe_points
+    points_y = fc_y.keyframe_points
 
     # Process all keyframes
-    num_keyframes = min(len(fc_x.keyframe_points), len(fc_y.keyframe_points))
+    num_keyframes = min(len(points_x), len(points_y))
 
-    for i in range(num_keyframes):
-        kp_x = fc_x.keyframe_points[i]
-        kp_y = fc_y.keyframe_points[i]
+    # Bulk-read keyframe coordinates as flat (frame, value) pairs
+    co_x = np.empty(len(points_x) * 2, dtype=np.float32)
+    co_y = np.empty(len(points_y) * 2, dtype=np.float32)
+    points_x.foreach_get("co", co_x)
+    points_y.foreach_get("co", co_y)
 
-        # Extract original X, Y values
-        x = kp_x.co[1]  # co[0] is frame, co[1] is value
-        y = kp_y.co[1]
+    # Values sit at odd indices (co[0] is frame, co[1] is value)
+    values = slice(1, num_keyframes * 2, 2)
+    x = co_x[values].astype(np.float64)
+    y = co_y[values].astype(np.float64)
 
-        # Apply 2D rotation
-        x_new, y_new = rotate_2d_point(x, y, angle_deg)
+    # Apply 2D rotation to all keyframes at once
+    cos_a, sin_a = get_rotation_cos_sin(angle_deg)
+    co_x[values] = x * cos_a - y * sin_a
+    co_y[values] = x * sin_a + y * cos_a
 
-        # Update keyframe values
-        kp_x.co[1] = x_new
-        kp_y.co[1] = y_new
+    # Write keyframe values back
+    points_x.foreach_set("co", co_x)
+    points_y.foreach_set("co", co_y)
 
     # Update fcurves to apply changes
     fc_x.update()
     fc_y.update()
 
 
-def stabilize_root_bone_axes(action, bone_name: str, axes: list = [0, 1]) -> int:
+def stabilize_root_bone_axes(action, bone_name: str, axes: list = [0, 1],
+                             location_fcurves: Optional[Dict[int, object]] = None) -> int:
     """
     Stabilize specified axes of root bone to origin (0, 0, 0).
 
+    Fcurves whose keyframes are already at the origin are left untouched.
+
     Args:
         action: Blender Action object
         bone_name: Name of the root bone
         axes: List of axis indices to stabilize (0=X, 1=Y, 2=Z)
+        location_fcurves: Result of get_location_fcurves(), if already known
 
     Returns:
-        Number of keyframes stabilized
+        Number of keyframes moved to the origin
     """
-    data_path = f'pose.bones["{bone_name}"].location'
-    fcurves_dict = {}
-
-    for fc in action.fcurves:
-        if fc.data_path == data_path:
-            fcurves_dict[fc.array_index] = fc
+    fcurves_dict = location_fcurves
+    if fcurves_dict is None:
+        fcurves_dict = get_location_fcurves(action, bone_name)
 
     if not fcurves_dict:
         return 0
@@ -186,14 +284,21 @@ def stabilize_root_bone_axes(action, bone_name: str, axes: list = [0, 1]) -> int
     for axis_index in axes:
         if axis_index in fcurves_dict:
             fc = fcurves_dict[axis_index]
+            points = fc.keyframe_points
 
-            if fc.keyframe_points:
-                # Set all keyframes to origin (0.0)
-                fixed_value = 0.0
+            if points:
+                co = np.empty(len(points) * 2, dtype=np.float32)
+                points.foreach_get("co", co)
+
+                # Skip the write and fcurve update if already at origin
+                modified = int(np.count_nonzero(co[1::2]))
+                if not modified:
+                    continue
 
-                for kp in fc.keyframe_points:
-                    kp.co[1] = fixed_value
-                    keyframe_count += 1
+                # Set all keyframes to origin (0.0)
+                co[1::2] = 0.0
+                points.foreach_set("co", co)
+                keyframe_count += modified
 
                 fc.update()
 
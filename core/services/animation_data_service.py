@@ -6,18 +6,23 @@ with validation and error handling.
 """
 
 from pathlib import Path
-from typing import List, Tuple, Optional
-import json
-import re
+from typing import Dict, List, Tuple, Optional
 import time
 
+from ..domain import json_utils, msgpack_utils
+from ..domain.fs_utils import sanitize_filename
 from ..domain.animation_data_entities import AnimationData
+from .file_listing import scan_names
 
 # Cache for animation list to avoid repeated file I/O
 _animation_list_cache = None
 _animation_list_cache_time = 0
 _CACHE_DURATION = 2.0  # Cache duration in seconds
 
+# Names read from animation files, keyed by filepath: (mtime_ns, size, name).
+# Files that haven't changed since the last listing aren't re-read.
+_animation_name_cache: Dict[str, Tuple[int, int, str]] = {}
+
 
 def get_animation_data_directory() -> Path:
     """
@@ -31,23 +36,19 @@ def get_animation_data_directory() -> Path:
     return anim_dir
 
 
-def sanitize_filename(name: str) -> str:
+def get_animation_filename(name: str, file_format: str = 'JSON') -> str:
     """
-    Sanitize animation name for use as filename.
+    Get the filename an animation is saved under in the default directory.
 
     Args:
-        name: Animation name to sanitize
+        name: Animation name
+        file_format: 'JSON' or 'MSGPACK'
 
     Returns:
-        str: Safe filename
+        str: Sanitized filename with the format's extension
     """
-    # Remove or replace invalid filename characters
-    safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
-    # Remove leading/trailing spaces and dots
-    safe_name = safe_name.strip('. ')
-    # Limit length
-    safe_name = safe_name[:100]
-    return safe_name
+    extension = msgpack_utils.MSGPACK_EXTENSION if file_format == 'MSGPACK' else '.json'
+    return f"{sanitize_filename(name)}{extension}"
 
 
 def invalidate_animation_list_cache():
@@ -63,14 +64,20 @@ def invalidate_animation_list_cache():
 
 def save_animation_data_to_file(
     anim_data: AnimationData,
-    filepath: Optional[str] = None
+    filepath: Optional[str] = None,
+    file_format: str = 'JSON'
 ) -> Tuple[bool, str]:
     """
     Save animation data to JSON file.
 
+    Files ending in .msgpack are written in the binary MessagePack
+    format instead (requires the msgpack package).
+
     Args:
         anim_data: AnimationData to save
         filepath: Optional custom filepath. If None, uses default directory
+        file_format: 'JSON' or 'MSGPACK'; picks the extension when saving
+            to the default directory
 
     Returns:
         Tuple[bool, str]: (success, message)
@@ -78,16 +85,15 @@ def save_animation_data_to_file(
     try:
         if filepath is None:
             anim_dir = get_animation_data_directory()
-            safe_name = sanitize_filename(anim_data.name)
-            filepath = anim_dir / f"{safe_name}.json"
+            filepath = anim_dir / get_animation_filename(anim_data.name, file_format)
         else:
             filepath = Path(filepath)
 
-        # Convert to JSON
-        json_str = anim_data.to_json()
-
-        # Write to file
-        filepath.write_text(json_str, encoding='utf-8')
+        # Convert to JSON (or MessagePack) and write to file
+        if filepath.suffix == msgpack_utils.MSGPACK_EXTENSION:
+            filepath.write_bytes(anim_data.to_msgpack())
+        else:
+            filepath.write_bytes(json_utils.dumps_bytes(anim_data.to_dict()))
 
         # Invalidate cache so new animation appears immediately
         invalidate_animation_list_cache()
@@ -100,7 +106,7 @@ def save_animation_data_to_file(
 
 def load_animation_data_from_file(filepath: str) -> Tuple[bool, str, Optional[AnimationData]]:
     """
-    Load animation data from JSON file.
+    Load animation data from JSON (or MessagePack) file.
 
     Args:
         filepath: Path to animation data file
@@ -114,20 +120,50 @@ def load_animation_data_from_file(filepath: str) -> Tuple[bool, str, Optional[An
         if not filepath.exists():
             return (False, f"Animation file not found: {filepath.name}", None)
 
-        # Read JSON
-        json_str = filepath.read_text(encoding='utf-8')
-
-        # Deserialize
-        anim_data = AnimationData.from_json(json_str)
+        # Read and deserialize JSON (both backends parse UTF-8 bytes directly)
+        data = filepath.read_bytes()
+        if msgpack_utils.is_msgpack(data[:16]):
+            anim_data = AnimationData.from_msgpack(data)
+        else:
+            anim_data = AnimationData.from_json(data)
 
         return (True, f"Animation loaded: {anim_data.name}", anim_data)
 
-    except json.JSONDecodeError as e:
+    except json_utils.JSONDecodeError as e:
         return (False, f"Invalid JSON format: {str(e)}", None)
     except Exception as e:
         return (False, f"Failed to load animation: {str(e)}", None)
 
 
+def _read_animation_name(filepath: Path) -> str:
+    """
+    Read the animation name stored in a file.
+
+    Args:
+        filepath: Path to animation data file
+
+    Returns:
+        str: Animation name, or the filename stem if the file is invalid
+    """
+    try:
+        # Read animation name from the file header; parse the whole
+        # file only if the name isn't the leading key
+        with filepath.open('rb') as f:
+            head = f.read(json_utils.NAME_HEADER_SIZE)
+        if msgpack_utils.is_msgpack(head):
+            data = msgpack_utils.unpackb(filepath.read_bytes())
+            return data.get('name', filepath.stem)
+
+        anim_name = json_utils.scan_leading_name(head)
+        if anim_name is None:
+            data = json_utils.loads(filepath.read_bytes())
+            anim_name = data.get('name', filepath.stem)
+        return anim_name
+    except Exception:
+        # If file is invalid, use filename
+        return filepath.stem
+
+
 def list_available_animations(use_cache: bool = True) -> List[Tuple[str, str]]:
     """
     List all available saved animations with caching for performance.
@@ -138,7 +174,7 @@ def list_available_animations(use_cache: bool = True) -> List[Tuple[str, str]]:
     Returns:
         List[Tuple[str, str]]: List of (animation_name, filepath) tuples
     """
-    global _animation_list_cache, _animation_list_cache_time
+    global _animation_list_cache, _animation_list_cache_time, _animation_name_cache
 
     current_time = time.time()
 
@@ -150,20 +186,9 @@ def list_available_animations(use_cache: bool = True) -> List[Tuple[str, str]]:
 
     # Rebuild cache
     anim_dir = get_animation_data_directory()
-    animations = []
-
-    for filepath in anim_dir.glob("*.json"):
-        try:
-            # Try to read animation name from file
-            json_str = filepath.read_text(encoding='utf-8')
-            data = json.loads(json_str)
-            anim_name = data.get('name', filepath.stem)
-            animations.append((anim_name, str(filepath)))
-        except Exception:
-            # If file is invalid, use filename
-            animations.append((filepath.stem, str(filepath)))
-
-    animations = sorted(animations, key=lambda x: x[0])
+    animations, _animation_name_cache, _ = scan_names(
+        anim_dir, ('.json', msgpack_utils.MSGPACK_EXTENSION), _read_animation_name,
+        _animation_name_cache)
 
     # Update cache
     _animation_list_cache = animations
@@ -222,8 +247,7 @@ def validate_animation_data(anim_data: AnimationData) -> Tuple[bool, str]:
         return (False, "Invalid frame range: end must be after start")
 
     # Check bones have fcurves
-    bones_with_fcurves = sum(1 for bone in anim_data.bones if bone.fcurves)
-    if bones_with_fcurves == 0:
+    if not any(bone.fcurves for bone in anim_data.bones):
         return (False, "No animation curves found")
 
     return (True, "Animation data is valid")
@@ -6,11 +6,16 @@ with validation and error handling.
 """
 
 from pathlib import Path
-from typing import List, Tuple, Optional
-import json
-import re
+from typing import Dict, List, Tuple, Optional
 
+from ..domain import json_utils
+from ..domain.fs_utils import sanitize_filename
 from ..domain.armature_entities import ArmatureTemplate
+from .file_listing import scan_names
+
+# Names read from template files, keyed by filepath: (mtime_ns, size, name).
+# Files that haven't changed since the last listing aren't re-read.
+_template_name_cache: Dict[str, Tuple[int, int, str]] = {}
 
 
 def get_armature_template_directory() -> Path:
@@ -25,25 +30,6 @@ def get_armature_template_directory() -> Path:
     return template_dir
 
 
-def sanitize_filename(name: str) -> str:
-    """
-    Sanitize template name for use as filename.
-
-    Args:
-        name: Template name to sanitize
-
-    Returns:
-        str: Safe filename
-    """
-    # Remove or replace invalid filename characters
-    safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
-    # Remove leading/trailing spaces and dots
-    safe_name = safe_name.strip('. ')
-    # Limit length
-    safe_name = safe_name[:100]
-    return safe_name
-
-
 def save_armature_template_to_file(
     template: ArmatureTemplate,
     filepath: Optional[str] = None
@@ -66,11 +52,8 @@ def save_armature_template_to_file(
         else:
             filepath = Path(filepath)
 
-        # Convert to JSON
-        json_str = template.to_json()
-
-        # Write to file
-        filepath.write_text(json_str, encoding='utf-8')
+        # Convert to JSON and write to file
+        filepath.write_bytes(json_utils.dumps_bytes(template.to_dict()))
 
         return (True, f"Armature template saved: {filepath.name}")
 
@@ -94,20 +77,41 @@ def load_armature_template_from_file(filepath: str) -> Tuple[bool, str, Optional
         if not filepath.exists():
             return (False, f"Template file not found: {filepath.name}", None)
 
-        # Read JSON
-        json_str = filepath.read_text(encoding='utf-8')
-
-        # Deserialize
-        template = ArmatureTemplate.from_json(json_str)
+        # Read and deserialize JSON (both backends parse UTF-8 bytes directly)
+        template = ArmatureTemplate.from_json(filepath.read_bytes())
 
         return (True, f"Template loaded: {template.name}", template)
 
-    except json.JSONDecodeError as e:
+    except json_utils.JSONDecodeError as e:
         return (False, f"Invalid JSON format: {str(e)}", None)
     except Exception as e:
         return (False, f"Failed to load template: {str(e)}", None)
 
 
+def _read_template_name(filepath: Path) -> str:
+    """
+    Read the template name stored in a file.
+
+    Args:
+        filepath: Path to template file
+
+    Returns:
+        str: Template name, or the filename stem if the file is invalid
+    """
+    try:
+        # Read template name from the file header; parse the whole
+        # file only if the name isn't the leading key
+        with filepath.open('rb') as f:
+            template_name = json_utils.scan_leading_name(f.read(json_utils.NAME_HEADER_SIZE))
+        if template_name is None:
+            data = json_utils.loads(filepath.read_bytes())
+            template_name = data.get('name', filepath.stem)
+        return template_name
+    except Exception:
+        # If file is invalid, use filename
+        return filepath.stem
+
+
 def list_available_armature_templates() -> List[Tuple[str, str]]:
     """
     List all available armature templates.
@@ -115,21 +119,12 @@ def list_available_armature_templates() -> List[Tuple[str, str]]:
     Returns:
         List[Tuple[str, str]]: List of (template_name, filepath) tuples
     """
-    template_dir = get_armature_template_directory()
-    templates = []
-
-    for filepath in template_dir.glob("*.json"):
-        try:
-            # Try to read template name from file
-            json_str = filepath.read_text(encoding='utf-8')
-            data = json.loads(json_str)
-            template_name = data.get('name', filepath.stem)
-            templates.append((template_name, str(filepath)))
-        except Exception:
-            # If file is invalid, use filename
-            templates.append((filepath.stem, str(filepath)))
+    global _template_name_cache
 
-    return sorted(templates, key=lambda x: x[0])
+    template_dir = get_armature_template_directory()
+    templates, _template_name_cache, _ = scan_names(
+        template_dir, '.json', _read_template_name, _template_name_cache)
+    return templates
 
 
 def delete_armature_template_file(filepath: str) -> Tuple[bool, str]:
@@ -173,20 +168,19 @@ def validate_armature_template(template: ArmatureTemplate) -> Tuple[bool, str]:
     if not template.bones:
         return (False, "Template must contain at least one bone")
 
-    # Check for duplicate bone names
-    bone_names = [bone.name for bone in template.bones]
-    if len(bone_names) != len(set(bone_names)):
-        return (False, "Template contains duplicate bone names")
+    # Check for duplicate bone names and self-parenting (basic circular
+    # dependency check) in one pass, stopping at the first problem
+    bone_name_set = set()
+    for bone in template.bones:
+        if bone.name in bone_name_set:
+            return (False, f"Template contains duplicate bone name '{bone.name}'")
+        if bone.parent_name == bone.name:
+            return (False, f"Bone '{bone.name}' cannot be its own parent")
+        bone_name_set.add(bone.name)
 
     # Validate bone hierarchy (parent references)
-    bone_name_set = set(bone_names)
     for bone in template.bones:
         if bone.parent_name and bone.parent_name not in bone_name_set:
             return (False, f"Bone '{bone.name}' references non-existent parent '{bone.parent_name}'")
 
-    # Check for circular dependencies (basic check)
-    for bone in template.bones:
-        if bone.parent_name == bone.name:
-            return (False, f"Bone '{bone.name}' cannot be its own parent")
-
     return (True, "Template is valid")
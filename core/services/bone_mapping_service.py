@@ -6,17 +6,21 @@ with validation and error handling.
 """
 
 from pathlib import Path
-from typing import List, Tuple, Optional
-import json
-import re
-import time
+from typing import Dict, List, Tuple, Optional
 
+from ..domain import json_utils
+from ..domain.fs_utils import sanitize_filename
 from ..domain.bone_mapping_entities import BoneMappingPreset
+from .file_listing import scan_names
 
-# Cache for mapping list to avoid repeated file I/O
+# Cache for mapping list to avoid repeated file I/O. Valid until the
+# directory's mtime changes (a file is added, removed or renamed).
 _mapping_list_cache = None
-_mapping_list_cache_time = 0
-_CACHE_DURATION = 2.0  # Cache duration in seconds
+_mapping_list_cache_mtime = 0
+
+# Names read from mapping files, keyed by filepath: (mtime_ns, size, name).
+# Files that haven't changed since the last listing aren't re-read.
+_mapping_name_cache: Dict[str, Tuple[int, int, str]] = {}
 
 
 def get_bone_mapping_directory() -> Path:
@@ -31,34 +35,15 @@ def get_bone_mapping_directory() -> Path:
     return mapping_dir
 
 
-def sanitize_filename(name: str) -> str:
-    """
-    Sanitize mapping preset name for use as filename.
-
-    Args:
-        name: Preset name to sanitize
-
-    Returns:
-        str: Safe filename
-    """
-    # Remove or replace invalid filename characters
-    safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
-    # Remove leading/trailing spaces and dots
-    safe_name = safe_name.strip('. ')
-    # Limit length
-    safe_name = safe_name[:100]
-    return safe_name
-
-
 def invalidate_mapping_list_cache():
     """
     Invalidate the mapping list cache.
 
     Call this when mappings are added, deleted, or modified.
     """
-    global _mapping_list_cache, _mapping_list_cache_time
+    global _mapping_list_cache, _mapping_list_cache_mtime
     _mapping_list_cache = None
-    _mapping_list_cache_time = 0
+    _mapping_list_cache_mtime = 0
 
 
 def save_bone_mapping_to_file(
@@ -86,11 +71,8 @@ def save_bone_mapping_to_file(
         else:
             filepath = Path(filepath)
 
-        # Convert to JSON
-        json_str = mapping_preset.to_json()
-
-        # Write to file
-        filepath.write_text(json_str, encoding='utf-8')
+        # Convert to JSON and write to file
+        filepath.write_bytes(json_utils.dumps_bytes(mapping_preset.to_dict()))
 
         # Invalidate cache so new mapping appears immediately
         invalidate_mapping_list_cache()
@@ -117,20 +99,41 @@ def load_bone_mapping_from_file(filepath: str) -> Tuple[bool, str, Optional[Bone
         if not filepath.exists():
             return (False, f"Bone mapping file not found: {filepath.name}", None)
 
-        # Read JSON
-        json_str = filepath.read_text(encoding='utf-8')
-
-        # Deserialize
-        mapping_preset = BoneMappingPreset.from_json(json_str)
+        # Read and deserialize JSON (both backends parse UTF-8 bytes directly)
+        mapping_preset = BoneMappingPreset.from_json(filepath.read_bytes())
 
         return (True, f"Bone mapping loaded: {mapping_preset.name}", mapping_preset)
 
-    except json.JSONDecodeError as e:
+    except json_utils.JSONDecodeError as e:
         return (False, f"Invalid JSON format: {str(e)}", None)
     except Exception as e:
         return (False, f"Failed to load bone mapping: {str(e)}", None)
 
 
+def _read_mapping_name(filepath: Path) -> str:
+    """
+    Read the bone mapping preset name stored in a file.
+
+    Args:
+        filepath: Path to bone mapping preset file
+
+    Returns:
+        str: Preset name, or the filename stem if the file is invalid
+    """
+    try:
+        # Read preset name from the file header; parse the whole
+        # file only if the name isn't the leading key
+        with filepath.open('rb') as f:
+            preset_name = json_utils.scan_leading_name(f.read(json_utils.NAME_HEADER_SIZE))
+        if preset_name is None:
+            data = json_utils.loads(filepath.read_bytes())
+            preset_name = data.get('name', filepath.stem)
+        return preset_name
+    except Exception:
+        # If file is invalid, use filename
+        return filepath.stem
+
+
 def list_available_bone_mappings(use_cache: bool = True) -> List[Tuple[str, str]]:
     """
     List all available saved bone mapping presets with caching for performance.
@@ -141,36 +144,23 @@ def list_available_bone_mappings(use_cache: bool = True) -> List[Tuple[str, str]
     Returns:
         List[Tuple[str, str]]: List of (preset_name, filepath) tuples
     """
-    global _mapping_list_cache, _mapping_list_cache_time
+    global _mapping_list_cache, _mapping_list_cache_mtime, _mapping_name_cache
 
-    current_time = time.time()
+    mapping_dir = get_bone_mapping_directory()
+    dir_mtime_ns = mapping_dir.stat().st_mtime_ns
 
-    # Return cached result if valid
+    # Return cached result if the directory hasn't changed
     if use_cache and _mapping_list_cache is not None:
-        cache_age = current_time - _mapping_list_cache_time
-        if cache_age < _CACHE_DURATION:
+        if dir_mtime_ns == _mapping_list_cache_mtime:
             return _mapping_list_cache
 
     # Rebuild cache
-    mapping_dir = get_bone_mapping_directory()
-    mappings = []
-
-    for filepath in mapping_dir.glob("*.json"):
-        try:
-            # Try to read mapping name from file
-            json_str = filepath.read_text(encoding='utf-8')
-            data = json.loads(json_str)
-            preset_name = data.get('name', filepath.stem)
-            mappings.append((preset_name, str(filepath)))
-        except Exception:
-            # If file is invalid, use filename
-            mappings.append((filepath.stem, str(filepath)))
-
-    mappings = sorted(mappings, key=lambda x: x[0])
+    mappings, _mapping_name_cache, dir_mtime_ns = scan_names(
+        mapping_dir, '.json', _read_mapping_name, _mapping_name_cache, persist=True)
 
     # Update cache
     _mapping_list_cache = mappings
-    _mapping_list_cache_time = current_time
+    _mapping_list_cache_mtime = dir_mtime_ns
 
     return mappings
 
@@ -228,22 +218,21 @@ def validate_bone_mapping_preset(mapping_preset: BoneMappingPreset) -> Tuple[boo
     if not mapping_preset.mappings:
         return (False, "Bone mapping must contain at least one bone mapping")
 
-    # Check for duplicate source bones
-    source_bones = [m.source_bone for m in mapping_preset.mappings]
-    if len(source_bones) != len(set(source_bones)):
-        return (False, "Duplicate source bone mappings found")
-
-    # Check for empty bone names
+    # Check for duplicate source bones, empty bone names and confidence
+    # values in one pass, stopping at the first problem
+    seen_source_bones = set()
     for mapping in mapping_preset.mappings:
-        if not mapping.source_bone or not mapping.source_bone.strip():
+        source_bone = mapping.source_bone
+        if source_bone in seen_source_bones:
+            return (False, f"Duplicate source bone mappings found: {source_bone}")
+        seen_source_bones.add(source_bone)
+        if not source_bone or not source_bone.strip():
             return (False, "Source bone name cannot be empty")
         if not mapping.target_bone or not mapping.target_bone.strip():
             return (False, "Target bone name cannot be empty")
-
-    # Check confidence values
-    for mapping in mapping_preset.mappings:
-        if mapping.confidence < 0.0 or mapping.confidence > 1.0:
-            return (False, f"Invalid confidence value for {mapping.source_bone}: {mapping.confidence}")
+        confidence = mapping.confidence
+        if confidence < 0.0 or confidence > 1.0:
+            return (False, f"Invalid confidence value for {source_bone}: {confidence}")
 
     return (True, "Bone mapping preset is valid")
 
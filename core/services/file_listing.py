@@ -0,0 +1,108 @@
+"""
+Directory scanning shared by the file-based services.
+
+Each service lists its storage directory as (name, filepath) pairs, where
+the name is read from the file. Names are cached per file so unchanged
+files aren't read again on the next listing.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .name_index import load_name_index, save_name_index
+
+# Read file names on a thread pool when more than this many files changed
+_PARALLEL_READ_THRESHOLD = 8
+
+
+def scan_names(
+    directory: Path,
+    suffixes: Union[str, Tuple[str, ...]],
+    read_name: Callable[[Path], Optional[str]],
+    name_cache: Dict[str, Tuple[int, int, Optional[str]]],
+    persist: bool = False
+) -> Tuple[List[Tuple[str, str]], Dict[str, Tuple[int, int, Optional[str]]], int]:
+    """
+    List the named files of a directory.
+
+    Dotfiles (such as the name index) are skipped, as are files whose
+    name can't be read (read_name returns None).
+
+    Args:
+        directory: Directory to scan
+        suffixes: File extension, or tuple of extensions, to include
+        read_name: Function reading the name stored in a file
+        name_cache: Names from the previous scan, keyed by filepath:
+            (mtime_ns, size, name)
+        persist: Keep the names in the directory's name index, so the
+            first scan of a session doesn't have to read every file
+
+    Returns:
+        Tuple of (list of (name, filepath) sorted by name, name cache to
+        pass to the next scan, directory mtime_ns the listing is current for)
+    """
+    entries_found = []
+    new_cache = {}
+    pending = []
+
+    # On the first scan of a session, reuse names recorded by the last one
+    if persist and not name_cache:
+        name_cache = load_name_index(directory)
+
+    try:
+        dir_mtime_ns = os.stat(directory).st_mtime_ns
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return [], {}, 0  # Directory was removed during the session
+
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.name.endswith(suffixes):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue  # Removed while scanning
+
+            # Reuse the name read on a previous scan if the file is unchanged.
+            # Copy and sync tools may keep the mtime of a replaced file, so
+            # compare the size as well.
+            cached = name_cache.get(entry.path)
+            if (cached is not None and cached[0] == stat.st_mtime_ns
+                    and cached[1] == stat.st_size):
+                new_cache[entry.path] = cached
+                if cached[2] is not None:
+                    entries_found.append((cached[2], entry.path))
+            else:
+                pending.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+    # Read names of new or modified files. Reads are I/O bound (the GIL is
+    # released), so overlap them when there are many, e.g. on a cold scan.
+    paths = [Path(path) for path, _, _ in pending]
+    if len(pending) > _PARALLEL_READ_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+            names = list(executor.map(read_name, paths))
+    else:
+        names = [read_name(path) for path in paths]
+
+    for (path, mtime_ns, size), name in zip(pending, names):
+        new_cache[path] = (mtime_ns, size, name)
+        if name is not None:
+            entries_found.append((name, path))
+
+    # Persist the names if any file was added, changed or removed
+    if persist and (pending or len(new_cache) != len(name_cache)):
+        save_name_index(directory, new_cache)
+        # Writing the index changes the directory's mtime. Report the new
+        # one so callers comparing it don't rescan for our own write.
+        try:
+            dir_mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            pass
+
+    entries_found.sort(key=lambda x: x[0])
+    return entries_found, new_cache, dir_mtime_ns
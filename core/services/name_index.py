@@ -0,0 +1,84 @@
+"""
+Persisted name index for preset directory listings.
+
+Listings cache the name read from each file, keyed by path, mtime and
+size.
+The index stores that cache in the preset directory itself, so the
+first listing of a session only has to read files that changed since
+the last one.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..domain import json_utils
+
+# Index file kept next to the presets. Listings skip dotfiles, so it is
+# never mistaken for a preset.
+INDEX_FILENAME = '.index.json'
+
+# Bump when the index layout changes; older indexes are ignored
+_INDEX_VERSION = 2
+
+
+def load_name_index(directory: Path) -> Dict[str, Tuple[int, int, Optional[str]]]:
+    """
+    Load the name index of a directory.
+
+    Args:
+        directory: Directory the index belongs to
+
+    Returns:
+        Dict mapping filepath to (mtime_ns, size, name); empty if there
+        is no usable index
+    """
+    try:
+        data = json_utils.loads((directory / INDEX_FILENAME).read_bytes())
+        if data.get('version') != _INDEX_VERSION:
+            return {}
+        base = str(directory)
+        return {
+            os.path.join(base, filename): (mtime_ns, size, name)
+            for filename, (mtime_ns, size, name) in data['files'].items()
+        }
+    except Exception:
+        # Missing or damaged index; the listing rebuilds it
+        return {}
+
+
+def save_name_index(directory: Path, name_cache: Dict[str, Tuple[int, int, Optional[str]]]):
+    """
+    Write the name index of a directory.
+
+    The index is written to a temporary file and then renamed over the
+    old one, so a concurrent listing (e.g. another Blender session) never
+    sees a half-written index. Failures are ignored: the index only speeds
+    up listing.
+
+    Args:
+        directory: Directory the index belongs to
+        name_cache: Dict mapping filepath to (mtime_ns, size, name)
+    """
+    data = {
+        'version': _INDEX_VERSION,
+        'files': {
+            os.path.basename(path): [mtime_ns, size, name]
+            for path, (mtime_ns, size, name) in name_cache.items()
+        },
+    }
+    try:
+        # Dot-prefixed, so listings skip it like the index itself
+        fd, tmp_path = tempfile.mkstemp(prefix=INDEX_FILENAME + '.', dir=directory)
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json_utils.dumps_bytes(data))
+        os.replace(tmp_path, directory / INDEX_FILENAME)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -5,10 +5,25 @@ Handles reading and writing preset files to disk.
 """
 
 import os
-import json
+import re
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+from ..domain import json_utils
 from ..domain.preset_entities import AnimationPreset
+from .file_listing import scan_names
+
+# Cache for preset list to avoid repeated file I/O. Valid until the
+# directory's mtime changes (a file is added, removed or renamed).
+_preset_list_cache = None
+_preset_list_cache_mtime = 0
+
+# Names read from preset files, keyed by filepath: (mtime_ns, size, name).
+# Invalid files are cached as None so they aren't re-read either.
+_preset_name_cache: Dict[str, Tuple[int, int, Optional[str]]] = {}
+
+# Characters dropped from preset names when building filenames: anything
+# other than letters, digits, spaces, '-' and '_'
+_UNSAFE_PRESET_CHARS_RE = re.compile(r'[^\w \-]')
 
 
 def get_preset_directory() -> Path:
@@ -24,6 +39,17 @@ def get_preset_directory() -> Path:
     return preset_dir
 
 
+def invalidate_preset_list_cache():
+    """
+    Invalidate the preset list cache.
+
+    Call this when presets are added, deleted, or modified.
+    """
+    global _preset_list_cache, _preset_list_cache_mtime
+    _preset_list_cache = None
+    _preset_list_cache_mtime = 0
+
+
 def save_preset_to_file(preset: AnimationPreset, filepath: Optional[str] = None) -> Tuple[bool, str]:
     """
     Save preset to JSON file.
@@ -39,14 +65,15 @@ def save_preset_to_file(preset: AnimationPreset, filepath: Optional[str] = None)
         if filepath is None:
             preset_dir = get_preset_directory()
             # Sanitize preset name for filename
-            safe_name = "".join(c for c in preset.name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_name = _UNSAFE_PRESET_CHARS_RE.sub('', preset.name).rstrip()
             filepath = str(preset_dir / f"{safe_name}.json")
 
         # Convert to JSON and save
-        json_data = preset.to_json()
+        with open(filepath, 'wb') as f:
+            f.write(json_utils.dumps_bytes(preset.to_dict()))
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(json_data)
+        # Invalidate cache so new preset appears immediately
+        invalidate_preset_list_cache()
 
         return (True, f"Preset saved: {filepath}")
 
@@ -68,40 +95,70 @@ def load_preset_from_file(filepath: str) -> Tuple[bool, str, Optional[AnimationP
         if not os.path.exists(filepath):
             return (False, f"Preset file not found: {filepath}", None)
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            json_str = f.read()
+        with open(filepath, 'rb') as f:
+            json_data = f.read()
 
-        preset = AnimationPreset.from_json(json_str)
+        preset = AnimationPreset.from_json(json_data)
         return (True, f"Preset loaded: {preset.name}", preset)
 
-    except json.JSONDecodeError as e:
+    except json_utils.JSONDecodeError as e:
         return (False, f"Invalid preset file format: {str(e)}", None)
     except Exception as e:
         return (False, f"Failed to load preset: {str(e)}", None)
 
 
-def list_available_presets() -> List[Tuple[str, str]]:
+def _read_preset_name(filepath: Path) -> Optional[str]:
+    """
+    Read the preset name stored in a file.
+
+    Args:
+        filepath: Path to preset file
+
+    Returns:
+        Preset name, or None if the file is invalid
+    """
+    try:
+        # Read preset name from the file header; parse the whole
+        # file only if the name isn't the leading key
+        with open(filepath, 'rb') as f:
+            preset_name = json_utils.scan_leading_name(f.read(json_utils.NAME_HEADER_SIZE))
+        if preset_name is None:
+            with open(filepath, 'rb') as f:
+                data = json_utils.loads(f.read())
+            preset_name = data.get('name', filepath.stem)
+        return preset_name
+    except Exception:
+        return None
+
+
+def list_available_presets(use_cache: bool = True) -> List[Tuple[str, str]]:
     """
     List all available preset files.
 
+    Args:
+        use_cache: Whether to use cached results (default: True)
+
     Returns:
         List of tuples (preset_name, filepath)
     """
+    global _preset_list_cache, _preset_list_cache_mtime, _preset_name_cache
+
     preset_dir = get_preset_directory()
-    presets = []
+    dir_mtime_ns = preset_dir.stat().st_mtime_ns
+
+    # Return cached result if the directory hasn't changed
+    if use_cache and _preset_list_cache is not None:
+        if dir_mtime_ns == _preset_list_cache_mtime:
+            return _preset_list_cache
 
-    for filepath in preset_dir.glob("*.json"):
-        try:
-            # Quick load to get preset name
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                preset_name = data.get('name', filepath.stem)
-                presets.append((preset_name, str(filepath)))
-        except:
-            # Skip invalid files
-            continue
+    presets, _preset_name_cache, dir_mtime_ns = scan_names(
+        preset_dir, '.json', _read_preset_name, _preset_name_cache, persist=True)
 
-    return sorted(presets, key=lambda x: x[0])
+    # Update cache
+    _preset_list_cache = presets
+    _preset_list_cache_mtime = dir_mtime_ns
+
+    return presets
 
 
 def delete_preset_file(filepath: str) -> Tuple[bool, str]:
@@ -119,6 +176,9 @@ def delete_preset_file(filepath: str) -> Tuple[bool, str]:
             return (False, f"Preset file not found: {filepath}")
 
         os.remove(filepath)
+
+        # Invalidate cache so deleted preset disappears immediately
+        invalidate_preset_list_cache()
         return (True, f"Preset deleted: {filepath}")
 
     except Exception as e:
@@ -48,28 +48,50 @@ def create_action_for_armature(armature_obj: bpy.types.Object, action_name: str)
     return action
 
 
-def apply_keyframe_to_fcurve(fcurve, keyframe_data: KeyframeData):
+def apply_keyframes_to_fcurve(fcurve, keyframes: List[KeyframeData]) -> int:
     """
-    Apply keyframe data to fcurve.
+    Apply a list of keyframes to an empty fcurve in bulk.
+
+    Allocates all keyframe points at once and writes coordinates and
+    handles as flat columns via foreach_set, instead of one
+    keyframe_points.insert() call per key.
 
     Args:
-        fcurve: Blender fcurve
-        keyframe_data: Keyframe data to apply
+        fcurve: Blender fcurve (expected to have no keyframe points)
+        keyframes: Keyframe data to apply
+
+    Returns:
+        int: Number of keyframes written
     """
-    # Insert keyframe
-    kf = fcurve.keyframe_points.insert(
-        frame=keyframe_data.frame,
-        value=keyframe_data.value
-    )
+    count = len(keyframes)
+    if count == 0:
+        return 0
 
-    # Set interpolation
-    kf.interpolation = keyframe_data.interpolation
+    keyframe_points = fcurve.keyframe_points
+    keyframe_points.add(count)
 
-    # Set handles
-    kf.handle_left = keyframe_data.handle_left
-    kf.handle_right = keyframe_data.handle_right
-    kf.handle_left_type = keyframe_data.handle_left_type
-    kf.handle_right_type = keyframe_data.handle_right_type
+    # Flat column buffers: (x, y) pairs per keyframe
+    co = [0.0] * (count * 2)
+    handle_left = [0.0] * (count * 2)
+    handle_right = [0.0] * (count * 2)
+    for i, kf in enumerate(keyframes):
+        j = i * 2
+        co[j] = kf.frame
+        co[j + 1] = kf.value
+        handle_left[j], handle_left[j + 1] = kf.handle_left
+        handle_right[j], handle_right[j + 1] = kf.handle_right
+
+    keyframe_points.foreach_set('co', co)
+    keyframe_points.foreach_set('handle_left', handle_left)
+    keyframe_points.foreach_set('handle_right', handle_right)
+
+    # Enum properties are set per keyframe
+    for point, kf in zip(keyframe_points, keyframes):
+        point.interpolation = kf.interpolation
+        point.handle_left_type = kf.handle_left_type
+        point.handle_right_type = kf.handle_right_type
+
+    return count
 
 
 def apply_fcurve_to_action(action, fcurve_data: FCurveData, bone_name: str, target_armature: bpy.types.Object) -> Optional[str]:
@@ -103,10 +125,7 @@ def apply_fcurve_to_action(action, fcurve_data: FCurveData, bone_name: str, targ
     fcurve.keyframe_points.clear()
 
     # Apply all keyframes
-    keyframe_count = 0
-    for keyframe_data in fcurve_data.keyframes:
-        apply_keyframe_to_fcurve(fcurve, keyframe_data)
-        keyframe_count += 1
+    keyframe_count = apply_keyframes_to_fcurve(fcurve, fcurve_data.keyframes)
 
     print(f"    Added {keyframe_count} keyframes to {data_path}[{fcurve_data.array_index}]")
 
@@ -171,12 +190,15 @@ def apply_animation_to_armature(
         action.frame_end = anim_data.frame_end
         print(f"Frame range: {int(anim_data.frame_start)} - {int(anim_data.frame_end)}")
 
+        # Look up target bone names once instead of querying pose.bones per bone
+        target_bone_names = set(armature_obj.pose.bones.keys())
+
         # Apply animation for each bone
         for bone_anim in anim_data.bones:
             bone_name = bone_anim.bone_name
 
             # Check if bone exists
-            if bone_name not in armature_obj.pose.bones:
+            if bone_name not in target_bone_names:
                 warnings.append(f"Bone not found in target: {bone_name}")
                 bones_skipped += 1
                 print(f"  ❌ Bone not found: {bone_name}")
@@ -12,7 +12,7 @@ import re
 from ..domain.animation_data_entities import AnimationData, BoneAnimationData, FCurveData, KeyframeData
 from ..domain.bone_mapping_entities import BoneMappingPreset
 from ..services.animation_data_service import load_animation_data_from_file
-from .apply_animation_data import create_action_for_armature, apply_keyframe_to_fcurve
+from .apply_animation_data import create_action_for_armature, apply_keyframes_to_fcurve
 
 
 def remap_bone_name_in_datapath(data_path: str, source_bone: str, target_bone: str) -> str:
@@ -78,10 +78,7 @@ def apply_fcurve_with_mapping(
     fcurve.keyframe_points.clear()
 
     # Apply all keyframes
-    keyframe_count = 0
-    for keyframe_data in fcurve_data.keyframes:
-        apply_keyframe_to_fcurve(fcurve, keyframe_data)
-        keyframe_count += 1
+    keyframe_count = apply_keyframes_to_fcurve(fcurve, fcurve_data.keyframes)
 
     print(f"    Added {keyframe_count} keyframes to {remapped_data_path}[{fcurve_data.array_index}]")
 
@@ -159,6 +156,9 @@ def apply_animation_with_bone_mapping(
         action.frame_end = anim_data.frame_end
         print(f"Frame range: {int(anim_data.frame_start)} - {int(anim_data.frame_end)}")
 
+        # Look up target bone names once instead of querying pose.bones per bone
+        target_bone_names = set(armature_obj.pose.bones.keys())
+
         # Apply animation for each bone with mapping
         for bone_anim in anim_data.bones:
             source_bone = bone_anim.bone_name
@@ -173,7 +173,7 @@ def apply_animation_with_bone_mapping(
                 continue
 
             # Check if target bone exists in armature
-            if target_bone not in armature_obj.pose.bones:
+            if target_bone not in target_bone_names:
                 warnings.append(f"Target bone not found in armature: {target_bone} (mapped from {source_bone})")
                 bones_skipped += 1
                 print(f"  ❌ Target bone not found: {target_bone}")
@@ -309,6 +309,8 @@ def validate_bone_mapping_for_animation(
         'coverage_percentage': 0.0
     }
 
+    target_bone_names = set(target_armature.pose.bones.keys())
+
     # Check each bone in animation
     for bone_anim in anim_data.bones:
         source_bone = bone_anim.bone_name
@@ -321,7 +323,7 @@ def validate_bone_mapping_for_animation(
             continue
 
         # Check if target exists in armature
-        if target_bone not in target_armature.pose.bones:
+        if target_bone not in target_bone_names:
             validation['missing_target_bones'].append(f"{source_bone} → {target_bone}")
         else:
             validation['valid_mappings'].append(f"{source_bone} → {target_bone}")
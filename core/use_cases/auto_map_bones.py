@@ -8,17 +8,39 @@ Implements intelligent bone name matching using multiple strategies:
 - String similarity scoring
 """
 
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional
 import re
 
 from ..domain.bone_mapping_entities import BoneMappingPreset, BoneMapping
 
-
+# Separators unified to '_' and runs of '_' collapsed in normalized names
+_SEPARATOR_RE = re.compile(r'[-:. ]')
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
+# Side suffix/prefix patterns, checked in order (first match wins)
+_LEFT_SIDE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'[._-]l$',      # .L, _L, -L
+    r'[._-]left$',   # .left, _left, -left
+    r'^l[._-]',      # L., L_, L-
+    r'^left[._-]',   # left., left_, left-
+))
+_RIGHT_SIDE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'[._-]r$',      # .R, _R, -R
+    r'[._-]right$',  # .right, _right, -right
+    r'^r[._-]',      # R., R_, R-
+    r'^right[._-]',  # right., right_, right-
+))
+
+
+@lru_cache(maxsize=4096)
 def normalize_bone_name(bone_name: str) -> str:
     """
     Normalize bone name for comparison.
 
     Removes common prefixes, normalizes case, and cleans up separators.
+    Results are cached: auto-mapping normalizes every target bone once
+    per source bone.
 
     Args:
         bone_name: Original bone name
@@ -48,10 +70,10 @@ def normalize_bone_name(bone_name: str) -> str:
             break
 
     # Normalize separators (convert all to underscore)
-    name = re.sub(r'[-:. ]', '_', name)
+    name = _SEPARATOR_RE.sub('_', name)
 
     # Remove duplicate underscores
-    name = re.sub(r'_+', '_', name)
+    name = _UNDERSCORE_RUN_RE.sub('_', name)
 
     # Strip leading/trailing underscores
     name = name.strip('_')
@@ -59,6 +81,7 @@ def normalize_bone_name(bone_name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=4096)
 def normalize_side_suffix(bone_name: str) -> Tuple[str, str]:
     """
     Extract and normalize side suffix (left/right) from bone name.
@@ -71,33 +94,15 @@ def normalize_side_suffix(bone_name: str) -> Tuple[str, str]:
     """
     name = bone_name.lower()
 
-    # Common left patterns
-    left_patterns = [
-        r'[._-]l$',      # .L, _L, -L
-        r'[._-]left$',   # .left, _left, -left
-        r'^l[._-]',      # L., L_, L-
-        r'^left[._-]',   # left., left_, left-
-    ]
-
-    # Common right patterns
-    right_patterns = [
-        r'[._-]r$',      # .R, _R, -R
-        r'[._-]right$',  # .right, _right, -right
-        r'^r[._-]',      # R., R_, R-
-        r'^right[._-]',  # right., right_, right-
-    ]
-
     # Check for left side
-    for pattern in left_patterns:
-        if re.search(pattern, name):
-            base = re.sub(pattern, '', name)
-            return (base, 'L')
+    for pattern in _LEFT_SIDE_PATTERNS:
+        if pattern.search(name):
+            return (pattern.sub('', name), 'L')
 
     # Check for right side
-    for pattern in right_patterns:
-        if re.search(pattern, name):
-            base = re.sub(pattern, '', name)
-            return (base, 'R')
+    for pattern in _RIGHT_SIDE_PATTERNS:
+        if pattern.search(name):
+            return (pattern.sub('', name), 'R')
 
     return (name, '')
 
@@ -212,7 +217,7 @@ def find_best_match(
             similarity = calculate_similarity(source_normalized, target_normalized)
 
             # Check side consistency
-            target_base, target_side = normalize_side_suffix(target_normalized)
+            _, target_side = normalize_side_suffix(target_normalized)
             if source_side and target_side and source_side != target_side:
                 # Penalize opposite sides
                 similarity *= 0.5
@@ -326,11 +331,11 @@ def suggest_mapping(
     suggestions = []
 
     source_normalized = normalize_bone_name(source_bone)
-    source_base, source_side = normalize_side_suffix(source_normalized)
+    _, source_side = normalize_side_suffix(source_normalized)
 
     for target in target_bones:
         target_normalized = normalize_bone_name(target)
-        target_base, target_side = normalize_side_suffix(target_normalized)
+        _, target_side = normalize_side_suffix(target_normalized)
 
         # Calculate similarity
         similarity = calculate_similarity(source_normalized, target_normalized)
@@ -58,9 +58,9 @@ def bake_nla_to_action(armature, context) -> tuple:
         armature.animation_data.use_nla = True
         armature.animation_data.use_tweak_mode = False
 
-        # Select all bones for baking
+        # Bake in pose mode. only_selected=False bakes every bone, so the
+        # bone selection doesn't need to be changed first.
         bpy.ops.object.mode_set(mode='POSE')
-        bpy.ops.pose.select_all(action='SELECT')
 
         # Bake the animation
         bpy.ops.nla.bake(
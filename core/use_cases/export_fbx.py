@@ -41,8 +41,9 @@ def export_armature_as_fbx(armature, filepath: str, include_mesh: bool, context)
         original_selection = context.selected_objects.copy()
         original_active = context.view_layer.objects.active
 
-        # Select armature
-        bpy.ops.object.select_all(action='DESELECT')
+        # Select armature (deselect directly; select_all is a full operator call)
+        for obj in original_selection:
+            obj.select_set(False)
         armature.select_set(True)
         context.view_layer.objects.active = armature
 
@@ -103,7 +104,8 @@ def export_armature_as_fbx(armature, filepath: str, include_mesh: bool, context)
         )
 
         # Restore selection
-        bpy.ops.object.select_all(action='DESELECT')
+        for obj in objects_to_export:
+            obj.select_set(False)
         for obj in original_selection:
             obj.select_set(True)
         context.view_layer.objects.active = original_active
@@ -56,6 +56,10 @@ def create_armature_from_template(
 
         edit_bones = armature_data.edit_bones
 
+        # Bone layers exist in Blender < 4.0 only (4.0+ uses collections);
+        # check once rather than per bone
+        supports_layers = 'layers' in bpy.types.EditBone.bl_rna.properties
+
         # Create all bones first (without parents)
         bone_map = {}
         for bone_data in template.bones:
@@ -75,12 +79,8 @@ def create_armature_from_template(
             edit_bone.use_deform = bone_data.use_deform
 
             # Set layers (compatibility: Blender < 4.0 only)
-            try:
-                if hasattr(edit_bone, 'layers'):
-                    edit_bone.layers = bone_data.layers
-                # Blender 4.0+ uses collections instead, skip layers
-            except AttributeError:
-                pass  # Layers not supported in this Blender version
+            if supports_layers:
+                edit_bone.layers = bone_data.layers
 
         # Now set up parent relationships
         for bone_data in template.bones:
@@ -106,7 +106,8 @@ def create_armature_from_template(
                                 pass
 
         # Select the new armature
-        bpy.ops.object.select_all(action='DESELECT')
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
         armature_obj.select_set(True)
         bpy.context.view_layer.objects.active = armature_obj
 
@@ -175,13 +176,16 @@ def load_armature_template_to_mesh(
         return (False, message, None)
 
     try:
-        # Parent mesh to armature with automatic weights
-        bpy.context.view_layer.objects.active = armature_obj
-        mesh_obj.select_set(True)
-        armature_obj.select_set(True)
-
-        # Set armature as parent with automatic weights
-        bpy.ops.object.parent_set(type='ARMATURE_AUTO')
+        # Parent mesh to armature with automatic weights.
+        # Scope the operator to just these two objects instead of
+        # shuffling the scene selection.
+        with bpy.context.temp_override(
+            active_object=armature_obj,
+            object=armature_obj,
+            selected_objects=[mesh_obj, armature_obj],
+            selected_editable_objects=[mesh_obj, armature_obj]
+        ):
+            bpy.ops.object.parent_set(type='ARMATURE_AUTO')
 
         message += f"\nParented to mesh: {mesh_obj.name}"
         return (True, message, armature_obj)
@@ -40,13 +40,12 @@ def find_action_by_name(action_name: str, available_actions: dict) -> str:
         """Extract the animation name from Mixamo pattern."""
         if not name:
             return ""
-        if "|mixamo.com|" in name:
-            # Return the part after "mixamo.com|"
-            return name.split("|mixamo.com|", 1)[-1]
-        elif "|" in name:
-            # Generic pattern: return part after last pipe
-            return name.split("|")[-1]
-        return name
+        # Return the part after "mixamo.com|"
+        _, sep, tail = name.partition("|mixamo.com|")
+        if sep:
+            return tail
+        # Generic pattern: return part after last pipe (or the whole name)
+        return name.rpartition("|")[2]
 
     target_anim_name = extract_animation_name(action_name)
 
@@ -80,13 +79,12 @@ def find_action_by_name(action_name: str, available_actions: dict) -> str:
 
     # Strategy 5: Fuzzy match - ignore armature prefix entirely
     # Match if the part after first "|" matches
-    if "|" in action_name:
-        target_suffix = action_name.split("|", 1)[-1]
+    _, sep, target_suffix = action_name.partition("|")
+    if sep:
         for available_name in available_actions.keys():
-            if "|" in available_name:
-                available_suffix = available_name.split("|", 1)[-1]
-                if target_suffix == available_suffix:
-                    return available_name
+            _, sep, available_suffix = available_name.partition("|")
+            if sep and target_suffix == available_suffix:
+                return available_name
 
     # No match found
     return None
@@ -114,6 +112,13 @@ def load_animation_preset(filepath: str, action_collection, settings) -> tuple:
     available_actions = {action.name: action for action in bpy.data.actions}
     warnings = []
 
+    # Map each action name to the first armature playing it, so matched
+    # actions don't each rescan every object in the file
+    action_armatures = {}
+    for obj in bpy.data.objects:
+        if obj.type == 'ARMATURE' and obj.animation_data and obj.animation_data.action:
+            action_armatures.setdefault(obj.animation_data.action.name, obj.name)
+
     # Debug: Log available actions
     print(f"\n=== PRESET LOADING DEBUG ===")
     print(f"Preset: {preset.name}")
@@ -152,11 +157,9 @@ def load_animation_preset(filepath: str, action_collection, settings) -> tuple:
         item.angle = preset_action.angle
 
         # Try to find armature for this action
-        for obj in bpy.data.objects:
-            if obj.type == 'ARMATURE' and obj.animation_data:
-                if obj.animation_data.action and obj.animation_data.action.name == found_action_name:
-                    item.armature_name = obj.name
-                    break
+        armature_name = action_armatures.get(found_action_name)
+        if armature_name:
+            item.armature_name = armature_name
 
         actions_loaded += 1
 
@@ -15,7 +15,9 @@ from ..domain.animation_data_entities import (
 )
 from ..services.animation_data_service import (
     save_animation_data_to_file,
-    validate_animation_data
+    validate_animation_data,
+    get_animation_data_directory,
+    get_animation_filename
 )
 
 
@@ -132,7 +134,8 @@ def save_animation_data(
     armature_obj: bpy.types.Object,
     action_name: str,
     save_name: str,
-    description: str = ""
+    description: str = "",
+    file_format: str = 'JSON'
 ) -> Tuple[bool, str, Optional[str]]:
     """
     Save animation data from armature action.
@@ -142,6 +145,7 @@ def save_animation_data(
         action_name: Name of action to save
         save_name: Name to save animation as
         description: Optional description
+        file_format: 'JSON' or 'MSGPACK' (requires the msgpack package)
 
     Returns:
         Tuple[bool, str, Optional[str]]: (success, message, filepath)
@@ -172,13 +176,11 @@ def save_animation_data(
             return (False, f"Validation failed: {validation_message}", None)
 
         # Save to file
-        success, message = save_animation_data_to_file(anim_data)
+        success, message = save_animation_data_to_file(anim_data, file_format=file_format)
 
         if success:
-            from ..services.animation_data_service import get_animation_data_directory, sanitize_filename
             anim_dir = get_animation_data_directory()
-            safe_name = sanitize_filename(anim_data.name)
-            filepath = str(anim_dir / f"{safe_name}.json")
+            filepath = str(anim_dir / get_animation_filename(anim_data.name, file_format))
 
             info_msg = f"{message}\nBones: {anim_data.bone_count}, Frames: {int(anim_data.frame_start)}-{int(anim_data.frame_end)}"
             return (True, info_msg, filepath)
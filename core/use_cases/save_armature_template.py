@@ -10,7 +10,9 @@ import bpy
 from ..domain.armature_entities import ArmatureTemplate, BoneData
 from ..services.armature_template_service import (
     save_armature_template_to_file,
-    validate_armature_template
+    validate_armature_template,
+    get_armature_template_directory,
+    sanitize_filename
 )
 
 
@@ -27,69 +29,53 @@ def extract_armature_structure(armature_obj: bpy.types.Object) -> ArmatureTempla
     armature_data = armature_obj.data
     bones_data = []
 
-    # We need to be in EDIT mode to access bone positions
-    # Save current mode
-    original_mode = armature_obj.mode if armature_obj.mode else 'OBJECT'
-    original_active = bpy.context.view_layer.objects.active
+    # Bone positions are read from the armature-space rest pose of each
+    # Bone, so there's no need to switch into EDIT mode (and back). If the
+    # armature is being edited, flush pending edit-bone changes first.
+    if armature_obj.mode == 'EDIT':
+        armature_obj.update_from_editmode()
 
-    try:
-        # Set as active and enter EDIT mode
-        bpy.context.view_layer.objects.active = armature_obj
-        bpy.ops.object.mode_set(mode='EDIT')
-
-        # Extract bone data
-        edit_bones = armature_data.edit_bones
-
-        for bone in edit_bones:
-            # Get parent name
-            parent_name = bone.parent.name if bone.parent else None
-
-            # Get layers (compatibility: Blender < 4.0 uses layers, >= 4.0 uses collections)
-            try:
-                if hasattr(bone, 'layers'):
-                    bone_layers = list(bone.layers)
-                else:
-                    # Blender 4.0+: No layers attribute, use default
-                    bone_layers = [True] + [False] * 31
-            except AttributeError:
-                bone_layers = [True] + [False] * 31
-
-            # Extract bone properties
-            bone_data = BoneData(
-                name=bone.name,
-                parent_name=parent_name,
-                head=tuple(bone.head),
-                tail=tuple(bone.tail),
-                roll=bone.roll,
-                use_connect=bone.use_connect,
-                use_inherit_rotation=bone.use_inherit_rotation,
-                inherit_scale=bone.inherit_scale,
-                use_local_location=bone.use_local_location,
-                use_deform=bone.use_deform,
-                layers=bone_layers
-            )
-
-            # Extract custom properties
-            if hasattr(bone, 'keys'):
-                for key in bone.keys():
-                    if key not in ['_RNA_UI']:
-                        try:
-                            bone_data.custom_properties[key] = bone[key]
-                        except:
-                            pass
-
-            bones_data.append(bone_data)
-
-    finally:
-        # Restore original mode and active object
-        bpy.ops.object.mode_set(mode='OBJECT')
-        if original_active:
-            bpy.context.view_layer.objects.active = original_active
-        if original_mode != 'OBJECT':
-            try:
-                bpy.ops.object.mode_set(mode=original_mode)
-            except:
-                pass
+    # Layers exist in Blender < 4.0 only (4.0+ uses collections)
+    supports_layers = 'layers' in bpy.types.Bone.bl_rna.properties
+
+    for bone in armature_data.bones:
+        # Get parent name
+        parent_name = bone.parent.name if bone.parent else None
+
+        # Recover the edit-mode roll from the bone's rest matrix
+        _, roll = bpy.types.Bone.AxisRollFromMatrix(bone.matrix_local.to_3x3())
+
+        # Get layers (compatibility: Blender < 4.0 uses layers, >= 4.0 uses collections)
+        if supports_layers:
+            layers_mask = BoneData.layers_to_mask(bone.layers)
+        else:
+            # Blender 4.0+: No layers attribute, use default
+            layers_mask = 1
+
+        # Extract bone properties
+        bone_data = BoneData(
+            name=bone.name,
+            parent_name=parent_name,
+            head=tuple(bone.head_local),
+            tail=tuple(bone.tail_local),
+            roll=roll,
+            use_connect=bone.use_connect,
+            use_inherit_rotation=bone.use_inherit_rotation,
+            inherit_scale=bone.inherit_scale,
+            use_local_location=bone.use_local_location,
+            use_deform=bone.use_deform,
+            layers_mask=layers_mask
+        )
+
+        # Extract custom properties
+        for key in bone.keys():
+            if key not in ['_RNA_UI']:
+                try:
+                    bone_data.custom_properties[key] = bone[key]
+                except:
+                    pass
+
+        bones_data.append(bone_data)
 
     # Create template
     template = ArmatureTemplate(
@@ -144,7 +130,6 @@ def save_armature_template(
         success, message = save_armature_template_to_file(template)
 
         if success:
-            from ..services.armature_template_service import get_armature_template_directory, sanitize_filename
             template_dir = get_armature_template_directory()
             safe_name = sanitize_filename(template.name)
             filepath = str(template_dir / f"{safe_name}.json")
@@ -2,9 +2,9 @@
 Use case: Send actions to NLA timeline with sequencing and blending.
 """
 
-from mathutils import Vector
 from ..services.action_service import (
     create_action_copy,
+    get_location_fcurves,
     rotate_action_root_trajectory,
     get_action_start_location_local,
     get_action_end_location_local,
@@ -37,7 +37,8 @@ def send_actions_to_timeline(armature, actions_with_params: list, root_bone: str
         armature.animation_data_clear()
     armature.animation_data_create()
 
-    prev_end_loc = Vector((0, 0, 0))
+    # Set from the first strip; only read for the strips after it
+    prev_end_loc = None
     current_start = 1
     track_index = 1
 
@@ -50,9 +51,12 @@ def send_actions_to_timeline(armature, actions_with_params: list, root_bone: str
             new_act = create_action_copy(act, repeat_index=r+1)
             length = int(new_act.frame_range[1] - new_act.frame_range[0])
 
+            # Look up root location fcurves once for all steps below
+            root_fcurves = get_location_fcurves(new_act, root_bone)
+
             # Apply angle rotation if specified
             if abs(angle_deg) > 0.001:
-                rotate_action_root_trajectory(new_act, root_bone, angle_deg, forward_axis)
+                rotate_action_root_trajectory(new_act, root_bone, angle_deg, forward_axis, root_fcurves)
 
             # Calculate strip timing
             if idx == 0 and r == 0:
@@ -82,13 +86,11 @@ def send_actions_to_timeline(armature, actions_with_params: list, root_bone: str
                 strip.blend_in = 0
                 strip.blend_out = 0
 
-            # Apply offset for continuity
-            start_loc = get_action_start_location_local(new_act, root_bone)
+            # Apply offset for continuity (the first strip stays in place)
             if idx > 0 or r > 0:
+                start_loc = get_action_start_location_local(new_act, root_bone, root_fcurves)
                 offset = prev_end_loc - start_loc
-                offset_action_root_local(new_act, root_bone, offset)
-            else:
-                offset = Vector((0, 0, 0))
+                offset_action_root_local(new_act, root_bone, offset, root_fcurves)
 
-            prev_end_loc = get_action_end_location_local(new_act, root_bone)
+            prev_end_loc = get_action_end_location_local(new_act, root_bone, root_fcurves)
             current_start = strip_end_int
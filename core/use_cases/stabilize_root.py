@@ -2,7 +2,7 @@
 Use case: Stabilize root bone for in-place animations.
 """
 
-from ..services.action_service import stabilize_root_bone_axes
+from ..services.action_service import get_location_fcurves, stabilize_root_bone_axes
 
 
 def stabilize_root_animation(armature, root_bone: str) -> tuple:
@@ -35,10 +35,9 @@ def stabilize_root_animation(armature, root_bone: str) -> tuple:
         return (False, f"Root bone '{root_bone}' not found in armature", 0)
 
     # Find location fcurves for root bone
-    data_path = f'pose.bones["{root_bone}"].location'
-    has_fcurves = any(fc.data_path == data_path for fc in action.fcurves)
+    root_fcurves = get_location_fcurves(action, root_bone)
 
-    if not has_fcurves:
+    if not root_fcurves:
         return (False, f"No location animation found for root bone '{root_bone}'", 0)
 
     # Disable NLA influence to work on action directly
@@ -46,7 +45,7 @@ def stabilize_root_animation(armature, root_bone: str) -> tuple:
     armature.animation_data.use_nla = False
 
     # Stabilize X and Y axes (keep Z for vertical movement like jumps)
-    keyframe_count = stabilize_root_bone_axes(action, root_bone, axes=[0, 1])
+    keyframe_count = stabilize_root_bone_axes(action, root_bone, axes=[0, 1], location_fcurves=root_fcurves)
 
     # Restore NLA state
     armature.animation_data.use_nla = nla_was_enabled
@@ -54,6 +53,9 @@ def stabilize_root_animation(armature, root_bone: str) -> tuple:
     if keyframe_count > 0:
         message = f"Root stabilized on X, Y axes ({keyframe_count} keyframes → origin). Action: {action.name}"
         success = True
+    elif 0 in root_fcurves or 1 in root_fcurves:
+        message = f"Root already stabilized on X, Y axes. Action: {action.name}"
+        success = True
     else:
         message = "No axes were stabilized"
         success = False